@@ -1,26 +1,26 @@
 from __future__ import annotations
 
 import csv
-import cv2
-import numpy as np
 import time
 import ctypes
+import operator
 import os
 from pathlib import Path
-import requests
-from mss import mss
 import json
 import difflib
-import tkinter as tk
+import functools
+import gc
+import itertools
+import math
 import re
 import threading
 import queue
 import sys
 import subprocess
 import ast  # needed for robust Crafting parsing
-
-from PIL import Image, ImageDraw, ImageFont, ImageTk
-from tesserocr import PyTessBaseAPI, PSM
+from collections import OrderedDict, defaultdict, namedtuple
+import atexit
+import hashlib
 
 try:
     from pynput import keyboard as pynput_keyboard, mouse as pynput_mouse
@@ -30,7 +30,28 @@ except ImportError:
     pynput_mouse = None
     PYNPUT_AVAILABLE = False
 
-from PySide6.QtCore import Qt
+try:
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    rf_fuzz = None
+    rf_process = None
+    RAPIDFUZZ_AVAILABLE = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON decoder for the catalog and its JSON-encoded columns (orjson when available)
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont, QPalette, QColor, QIcon, QAction
 from PySide6.QtWidgets import (
     QApplication,
@@ -117,76 +138,70 @@ DEFAULT_SETTINGS = {
     "tooltip_sell_color": "#28ff28ff",
 }
 
+# keys accepted from the settings file; anything else is dropped on load
+_ALLOWED_KEYS = frozenset(DEFAULT_SETTINGS)
+_HOTKEY_KEYS = frozenset(("device", "key"))
 
-def load_settings() -> dict:
+# numeric settings: key -> (type, min, max); out-of-range values are clamped,
+# unparseable ones fall back to DEFAULT_SETTINGS
+_SETTING_SPEC = {
+    "tooltip_font_size": (int, 10, 32),
+    "tooltip_alpha": (float, 0.1, 1.0),
+}
+
+_COLOR_KEYS = (
+    "tooltip_panel_color",
+    "tooltip_text_primary_color",
+    "tooltip_text_secondary_color",
+    "tooltip_keep_color",
+    "tooltip_recycle_color",
+    "tooltip_sell_color",
+)
+
+
+# last parsed settings, keyed on the file's mtime so unchanged files are not re-read
+_SETTINGS_CACHE = {"mtime": None, "data": None}
+
+# digest of the settings payload last written to / read from disk
+_LAST_SAVED_HASH: str | None = None
+
+
+def _coerce_setting(key: str, raw):
     """
-    Load settings from JSON, merging with DEFAULT_SETTINGS and validating
-    basic structure.
+    Convert a numeric setting per _SETTING_SPEC, clamping it into range.
+    NaN and infinities (stdlib json accepts them) fall back to the default.
     """
-    if not SETTINGS_PATH.is_file():
-        return DEFAULT_SETTINGS.copy()
-
+    kind, lo, hi = _SETTING_SPEC[key]
     try:
-        with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except Exception:
-        return DEFAULT_SETTINGS.copy()
+        v = kind(raw)
+    except (TypeError, ValueError, OverflowError):
+        return DEFAULT_SETTINGS[key]
+    if not math.isfinite(v):
+        return DEFAULT_SETTINGS[key]
+    return lo if v < lo else hi if v > hi else v
 
-    if not isinstance(data, dict):
-        return DEFAULT_SETTINGS.copy()
 
+def _validate_settings(data: dict) -> dict:
+    """
+    Merge a raw settings dict with DEFAULT_SETTINGS and validate each field.
+
+    Shared by load_settings() and settings pushed to the helper over stdin.
+    """
     merged = DEFAULT_SETTINGS.copy()
-    merged.update(
-        {
-            k: v
-            for k, v in data.items()
-            if k
-               in (
-                   "always_on",
-                   "hotkey",
-                   "cycle_hotkey",
-                   "tooltip_font_size",
-                   "show_rr_and_crafting",
-                   "tooltip_alpha",
-                   "tooltip_panel_color",
-                   "tooltip_text_primary_color",
-                   "tooltip_text_secondary_color",
-                   "tooltip_keep_color",
-                   "tooltip_recycle_color",
-                   "tooltip_sell_color",
-               )
-        }
-    )
+    merged.update({k: v for k, v in data.items() if k in _ALLOWED_KEYS})
 
     if isinstance(data.get("hotkey"), dict):
         hk = DEFAULT_SETTINGS["hotkey"].copy()
-        hk.update({k: v for k, v in data["hotkey"].items() if k in ("device", "key")})
+        hk.update({k: v for k, v in data["hotkey"].items() if k in _HOTKEY_KEYS})
         merged["hotkey"] = hk
 
     if isinstance(data.get("cycle_hotkey"), dict):
         chk = DEFAULT_SETTINGS["cycle_hotkey"].copy()
-        chk.update(
-            {k: v for k, v in data["cycle_hotkey"].items() if k in ("device", "key")}
-        )
+        chk.update({k: v for k, v in data["cycle_hotkey"].items() if k in _HOTKEY_KEYS})
         merged["cycle_hotkey"] = chk
 
-    # Basic validation for tooltip_font_size
-    tfs = data.get("tooltip_font_size", merged.get("tooltip_font_size"))
-    try:
-        tfs_int = int(tfs)
-        merged["tooltip_font_size"] = max(10, min(32, tfs_int))
-    except (TypeError, ValueError):
-        merged["tooltip_font_size"] = DEFAULT_SETTINGS["tooltip_font_size"]
-
-    # tooltip_alpha
-    alpha_raw = data.get("tooltip_alpha", merged.get("tooltip_alpha"))
-    try:
-        alpha_val = float(alpha_raw)
-        if not (0.1 <= alpha_val <= 1.0):
-            raise ValueError
-    except (TypeError, ValueError):
-        alpha_val = DEFAULT_SETTINGS["tooltip_alpha"]
-    merged["tooltip_alpha"] = alpha_val
+    for key in _SETTING_SPEC:
+        merged[key] = _coerce_setting(key, merged[key])
 
     # show_rr_and_crafting
     merged["show_rr_and_crafting"] = bool(
@@ -194,15 +209,7 @@ def load_settings() -> dict:
     )
 
     # normalize color strings
-    color_keys = (
-        "tooltip_panel_color",
-        "tooltip_text_primary_color",
-        "tooltip_text_secondary_color",
-        "tooltip_keep_color",
-        "tooltip_recycle_color",
-        "tooltip_sell_color",
-    )
-    for ck in color_keys:
+    for ck in _COLOR_KEYS:
         val = data.get(ck, merged.get(ck, DEFAULT_SETTINGS.get(ck)))
         if isinstance(val, str) and val.strip():
             merged[ck] = val.strip()
@@ -212,17 +219,71 @@ def load_settings() -> dict:
     return merged
 
 
+def load_settings() -> dict:
+    """
+    Load settings from JSON, merging with DEFAULT_SETTINGS and validating
+    basic structure.
+
+    The merged result is cached until the file's mtime changes.
+    """
+    try:
+        st = SETTINGS_PATH.stat()
+    except OSError:
+        return DEFAULT_SETTINGS.copy()
+
+    if _SETTINGS_CACHE["data"] is not None and st.st_mtime_ns == _SETTINGS_CACHE["mtime"]:
+        return _SETTINGS_CACHE["data"].copy()
+
+    global _LAST_SAVED_HASH
+    try:
+        raw = SETTINGS_PATH.read_bytes()
+        data = _json_loads(raw)
+    except Exception:
+        return DEFAULT_SETTINGS.copy()
+
+    if _LAST_SAVED_HASH is None:
+        _LAST_SAVED_HASH = _settings_digest(raw)
+
+    if not isinstance(data, dict):
+        return DEFAULT_SETTINGS.copy()
+
+    merged = _validate_settings(data)
+
+    _SETTINGS_CACHE["mtime"] = st.st_mtime_ns
+    _SETTINGS_CACHE["data"] = merged
+    return merged.copy()
+
+
+def _settings_digest(payload: bytes) -> str:
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
 def save_settings(settings: dict) -> None:
     """
     Save settings dict to JSON.
+
+    The write is skipped if the serialized payload is identical to what
+    was last written (or read) and the file still exists. Otherwise the
+    payload goes to a temp file that atomically replaces the settings file,
+    so the helper never reads a half-written file.
     """
-    with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-        json.dump(settings, f, indent=2)
+    global _LAST_SAVED_HASH
+    payload = json.dumps(settings, separators=(",", ":")).encode("utf-8")
+    digest = _settings_digest(payload)
+    if digest == _LAST_SAVED_HASH and SETTINGS_PATH.is_file():
+        return
+
+    tmp_path = SETTINGS_PATH.with_suffix(SETTINGS_PATH.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, SETTINGS_PATH)
+    _LAST_SAVED_HASH = digest
 
 
 SETTINGS = DEFAULT_SETTINGS.copy()
 HOTKEY_HELD = False
 HOTKEY_LISTENERS_STARTED = False
+HOTKEY_POLLING = False
 
 USER_VERDICTS: dict[str, str] = {}
 TOOLTIP_NEEDS_REFRESH = False
@@ -231,24 +292,43 @@ TOOLTIP_NEEDS_REFRESH = False
 TOOLTIP_ALPHA = DEFAULT_SETTINGS["tooltip_alpha"]
 
 
-def refresh_settings():
+# (setting, device) -> lower-cased key name, for the pynput callbacks; rebuilt
+# by refresh_settings and swapped in whole so listener threads never see a
+# half-built table
+_HOTKEY_TARGETS: dict[tuple[str, str], str] = {}
+
+
+def _rebuild_hotkey_targets():
+    global _HOTKEY_TARGETS
+    targets = {}
+    for setting in ("hotkey", "cycle_hotkey"):
+        cfg = SETTINGS.get(setting) or {}
+        key = (cfg.get("key") or "").lower()
+        if key:
+            targets[(setting, cfg.get("device"))] = key
+    _HOTKEY_TARGETS = targets
+
+
+def refresh_settings(data: dict | None = None):
     """
-    Refresh SETTINGS from the shared settings file and update tooltip alpha.
+    Refresh SETTINGS and update tooltip alpha.
+
+    `data` is a raw settings dict pushed by the settings UI; without it the
+    shared settings file is read.
     """
     global SETTINGS, TOOLTIP_ALPHA, TOOLTIP_ROOT
     try:
-        SETTINGS = load_settings()
+        SETTINGS = load_settings() if data is None else _validate_settings(data)
     except Exception as e:
         print(f"[helper] Failed to load settings from {SETTINGS_PATH}: {e}")
         SETTINGS = DEFAULT_SETTINGS.copy()
 
+    _rebuild_hotkey_targets()
+
     # keep TOOLTIP_ALPHA in sync
-    try:
-        alpha = float(SETTINGS.get("tooltip_alpha", DEFAULT_SETTINGS["tooltip_alpha"]))
-    except (TypeError, ValueError):
-        alpha = DEFAULT_SETTINGS["tooltip_alpha"]
-    alpha = max(0.1, min(1.0, alpha))
-    TOOLTIP_ALPHA = alpha
+    TOOLTIP_ALPHA = _coerce_setting(
+        "tooltip_alpha", SETTINGS.get("tooltip_alpha", DEFAULT_SETTINGS["tooltip_alpha"])
+    )
 
     # if overlay already exists, update its alpha
     if "TOOLTIP_ROOT" in globals():
@@ -259,6 +339,198 @@ def refresh_settings():
             pass
 
 
+SETTINGS_PUSH_QUEUE: queue.Queue = queue.Queue()
+
+
+def _settings_pipe_reader():
+    """
+    Read JSON-line commands from the settings UI on stdin.
+
+    Understood are {"type": "settings", "data": {...}} and
+    {"type": "shutdown"}; anything else (e.g. typing into a console-launched
+    helper) is ignored.
+    """
+    for line in sys.stdin:
+        try:
+            msg = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(msg, dict):
+            continue
+        if msg.get("type") == "settings" and isinstance(msg.get("data"), dict):
+            SETTINGS_PUSH_QUEUE.put(msg["data"])
+        elif msg.get("type") == "shutdown":
+            # write a verdict change still inside its debounce window, then
+            # exit without waiting on the Tk loop in the main thread
+            flush_verdict_save()
+            os._exit(0)
+
+
+def start_settings_pipe_reader():
+    if sys.stdin is None:
+        return
+    threading.Thread(target=_settings_pipe_reader, daemon=True).start()
+
+
+# Set by the watchdog observer when the settings file is touched on disk;
+# SETTINGS_WATCHER_ACTIVE says whether main_live can rely on it.
+SETTINGS_FILE_CHANGED = threading.Event()
+SETTINGS_WATCHER_ACTIVE = False
+
+
+def start_settings_watcher():
+    """
+    Watch the config directory with watchdog, when installed, so hand edits
+    to the settings file are noticed without stat polling.
+    """
+    global SETTINGS_WATCHER_ACTIVE
+
+    # helper-only and optional, so imported here rather than at module load
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer as WatchdogObserver
+    except ImportError:
+        return
+
+    target = SETTINGS_PATH.name
+
+    class _SettingsFileHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            paths = (event.src_path, getattr(event, "dest_path", "") or "")
+            if any(os.path.basename(os.fsdecode(p)) == target for p in paths):
+                SETTINGS_FILE_CHANGED.set()
+
+    try:
+        SETTINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        observer = WatchdogObserver()
+        observer.schedule(_SettingsFileHandler(), str(SETTINGS_PATH.parent))
+        observer.daemon = True
+        observer.start()
+    except Exception as e:
+        print(f"[helper] Settings watcher unavailable, polling instead: {e}")
+        return
+
+    SETTINGS_WATCHER_ACTIVE = True
+
+
+def take_pushed_settings() -> dict | None:
+    """
+    Return the most recent settings dict pushed over stdin, or None.
+    """
+    data = None
+    while True:
+        try:
+            data = SETTINGS_PUSH_QUEUE.get_nowait()
+        except queue.Empty:
+            return data
+
+
+# Single application-wide stylesheet; widgets opt in via setObjectName().
+APP_QSS = """
+QPushButton {
+    background-color: #3c4043;
+    color: #e8eaed;
+    border-radius: 6px;
+    padding: 6px 12px;
+    border: 1px solid #5f6368;
+    font-size: 12px;
+}
+QPushButton:hover {
+    background-color: #5f6368;
+}
+QPushButton:pressed {
+    background-color: #8ab4f8;
+    border-color: #8ab4f8;
+    color: #202124;
+}
+QCheckBox::indicator {
+    width: 16px;
+    height: 16px;
+}
+QCheckBox::indicator:unchecked {
+    border-radius: 3px;
+    border: 1px solid #5f6368;
+    background-color: #171717;
+}
+QCheckBox::indicator:checked {
+    border-radius: 3px;
+    border: 1px solid #8ab4f8;
+    background-color: #8ab4f8;
+}
+QCheckBox#AlwaysOnCheck {
+    font-size: 13px;
+}
+QLabel#WindowTitle {
+    font-size: 20px;
+    font-weight: 600;
+}
+QLabel#WindowSubtitle {
+    color: #9aa0a6;
+    font-size: 12px;
+}
+QLabel#Footer {
+    color: #9aa0a6;
+    font-size: 11px;
+}
+QLabel#DialogTitle {
+    font-size: 15px;
+    font-weight: 600;
+}
+QLabel#DialogSubtitle {
+    color: #9aa0a6;
+    font-size: 12px;
+}
+QFrame#DialogSeparator {
+    color: #5f6368;
+}
+QFrame#Card {
+    background-color: #202124;
+    border-radius: 10px;
+    border: 1px solid #3c4043;
+}
+QLineEdit#HotkeyEdit, QLineEdit#CycleHotkeyEdit {
+    border-radius: 6px;
+    border: 1px solid #5f6368;
+    padding: 4px 8px;
+    background-color: #171717;
+    color: #e8eaed;
+    font-size: 12px;
+}
+QLineEdit#HotkeyEdit:disabled, QLineEdit#CycleHotkeyEdit:disabled {
+    color: #5f6368;
+}
+"""
+
+
+_QT_KEY_MAP = {
+    Qt.Key_F1: "f1",
+    Qt.Key_F2: "f2",
+    Qt.Key_F3: "f3",
+    Qt.Key_F4: "f4",
+    Qt.Key_F5: "f5",
+    Qt.Key_F6: "f6",
+    Qt.Key_F7: "f7",
+    Qt.Key_F8: "f8",
+    Qt.Key_F9: "f9",
+    Qt.Key_F10: "f10",
+    Qt.Key_F11: "f11",
+    Qt.Key_F12: "f12",
+    Qt.Key_Tab: "tab",
+    Qt.Key_Shift: "shift",
+    Qt.Key_Control: "ctrl",
+    Qt.Key_Alt: "alt",
+    Qt.Key_Space: "space",
+}
+
+_QT_BTN_MAP = {
+    Qt.LeftButton: "left",
+    Qt.RightButton: "right",
+    Qt.MiddleButton: "middle",
+    Qt.XButton1: "x1",
+    Qt.XButton2: "x2",
+}
+
+
 class HotkeyCaptureDialog(QDialog):
     """
     Minimal, clean dialog that waits for *one* key or mouse button press
@@ -284,18 +556,18 @@ class HotkeyCaptureDialog(QDialog):
 
         title = QLabel("Press a key or mouse button")
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("font-size: 15px; font-weight: 600;")
+        title.setObjectName("DialogTitle")
         layout.addWidget(title)
 
         subtitle = QLabel("Press ESC to cancel.")
         subtitle.setAlignment(Qt.AlignCenter)
-        subtitle.setStyleSheet("color: #9aa0a6; font-size: 12px;")
+        subtitle.setObjectName("DialogSubtitle")
         layout.addWidget(subtitle)
 
         line = QFrame()
         line.setFrameShape(QFrame.HLine)
         line.setFrameShadow(QFrame.Sunken)
-        line.setStyleSheet("color: #5f6368;")
+        line.setObjectName("DialogSeparator")
         layout.addWidget(line)
 
         button_box = QDialogButtonBox(QDialogButtonBox.Cancel)
@@ -314,26 +586,7 @@ class HotkeyCaptureDialog(QDialog):
         if text and text.strip():
             key_str = text.lower()
         else:
-            key_map = {
-                Qt.Key_F1: "f1",
-                Qt.Key_F2: "f2",
-                Qt.Key_F3: "f3",
-                Qt.Key_F4: "f4",
-                Qt.Key_F5: "f5",
-                Qt.Key_F6: "f6",
-                Qt.Key_F7: "f7",
-                Qt.Key_F8: "f8",
-                Qt.Key_F9: "f9",
-                Qt.Key_F10: "f10",
-                Qt.Key_F11: "f11",
-                Qt.Key_F12: "f12",
-                Qt.Key_Tab: "tab",
-                Qt.Key_Shift: "shift",
-                Qt.Key_Control: "ctrl",
-                Qt.Key_Alt: "alt",
-                Qt.Key_Space: "space",
-            }
-            key_str = key_map.get(k)
+            key_str = _QT_KEY_MAP.get(k)
             if key_str is None:
                 key_str = event.text().lower() or f"key_{k}"
 
@@ -343,14 +596,7 @@ class HotkeyCaptureDialog(QDialog):
 
     def mousePressEvent(self, event):
         btn = event.button()
-        btn_map = {
-            Qt.LeftButton: "left",
-            Qt.RightButton: "right",
-            Qt.MiddleButton: "middle",
-            Qt.XButton1: "x1",
-            Qt.XButton2: "x2",
-        }
-        key_str = btn_map.get(btn)
+        key_str = _QT_BTN_MAP.get(btn)
         if not key_str:
             return
         self.device = "mouse"
@@ -358,25 +604,40 @@ class HotkeyCaptureDialog(QDialog):
         self.accept()
 
 
+SETTINGS_SAVE_DEBOUNCE_MS = 200
+
+_COLOR_HINT = "#RRGGBB or #RRGGBBAA"
+
+# (label, settings key, placeholder, SettingsWindow attribute) per color row
+_COLOR_ROW_SPEC = (
+    ("Panel color:", "tooltip_panel_color", _COLOR_HINT, "panel_color_edit"),
+    ("Primary text color:", "tooltip_text_primary_color", _COLOR_HINT, "text_primary_color_edit"),
+    ("Secondary text color:", "tooltip_text_secondary_color", _COLOR_HINT, "text_secondary_color_edit"),
+    ("KEEP color:", "tooltip_keep_color", "#ff2828ff", "keep_color_edit"),
+    ("RECYCLE color:", "tooltip_recycle_color", "#28ffffff", "recycle_color_edit"),
+    ("SELL color:", "tooltip_sell_color", "#28ff28ff", "sell_color_edit"),
+)
+
+
 class SettingsWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, helper_process: subprocess.Popen | None = None):
         super().__init__()
         self.setWindowTitle("ARC Companion")
         self.setWindowFlag(Qt.WindowContextHelpButtonHint, False)
 
         self._allow_close = False
 
-        self.helper_process: subprocess.Popen | None = None
+        self.helper_process: subprocess.Popen | None = helper_process
 
         self._init_responsive_size()
 
         self.settings = load_settings()
 
-        if not SETTINGS_PATH.is_file():
-            try:
-                save_settings(self.settings)
-            except Exception:
-                pass
+        # coalesce bursts of edits (e.g. typing a color) into a single write
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(SETTINGS_SAVE_DEBOUNCE_MS)
+        self._save_timer.timeout.connect(self._save_current_settings)
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -387,24 +648,15 @@ class SettingsWindow(QMainWindow):
 
         header_layout = QVBoxLayout()
         title = QLabel("ARC Companion")
-        title.setStyleSheet("font-size: 20px; font-weight: 600;")
+        title.setObjectName("WindowTitle")
         subtitle = QLabel("Configure how the overlay is triggered while you play.")
-        subtitle.setStyleSheet("color: #9aa0a6; font-size: 12px;")
+        subtitle.setObjectName("WindowSubtitle")
         header_layout.addWidget(title)
         header_layout.addWidget(subtitle)
         main_layout.addLayout(header_layout)
 
         card = QFrame()
         card.setObjectName("Card")
-        card.setStyleSheet(
-            """
-            QFrame#Card {
-                background-color: #202124;
-                border-radius: 10px;
-                border: 1px solid #3c4043;
-            }
-            """
-        )
         card_layout = QVBoxLayout(card)
         card_layout.setContentsMargins(16, 14, 16, 14)
         card_layout.setSpacing(12)
@@ -418,21 +670,6 @@ class SettingsWindow(QMainWindow):
         self.hotkey_edit.setReadOnly(True)
         self.hotkey_edit.setObjectName("HotkeyEdit")
         self.hotkey_edit.setFixedHeight(32)
-        self.hotkey_edit.setStyleSheet(
-            """
-            QLineEdit#HotkeyEdit {
-                border-radius: 6px;
-                border: 1px solid #5f6368;
-                padding: 4px 8px;
-                background-color: #171717;
-                color: #e8eaed;
-                font-size: 12px;
-            }
-            QLineEdit#HotkeyEdit:disabled {
-                color: #5f6368;
-            }
-            """
-        )
 
         self.update_hotkey_display()
 
@@ -455,21 +692,6 @@ class SettingsWindow(QMainWindow):
         self.cycle_hotkey_edit.setReadOnly(True)
         self.cycle_hotkey_edit.setObjectName("CycleHotkeyEdit")
         self.cycle_hotkey_edit.setFixedHeight(32)
-        self.cycle_hotkey_edit.setStyleSheet(
-            """
-            QLineEdit#CycleHotkeyEdit {
-                border-radius: 6px;
-                border: 1px solid #5f6368;
-                padding: 4px 8px;
-                background-color: #171717;
-                color: #e8eaed;
-                font-size: 12px;
-            }
-            QLineEdit#CycleHotkeyEdit:disabled {
-                color: #5f6368;
-            }
-            """
-        )
 
         self.update_cycle_hotkey_display()
 
@@ -546,218 +768,34 @@ class SettingsWindow(QMainWindow):
         card_layout.addLayout(opacity_row)
 
         # Color rows use line edit + color picker button
-        color_hint = "#RRGGBB or #RRGGBBAA"
-
-        # Panel color
-        panel_row = QHBoxLayout()
-        lbl_panel = QLabel("Panel color:")
-        lbl_panel.setMinimumWidth(160)
-
-        self.panel_color_edit = QLineEdit()
-        self.panel_color_edit.setFixedHeight(32)
-        self.panel_color_edit.setPlaceholderText(color_hint)
-        self.panel_color_edit.setText(
-            str(
-                self.settings.get(
-                    "tooltip_panel_color",
-                    DEFAULT_SETTINGS.get("tooltip_panel_color", "#3737370f"),
-                )
-            )
-        )
-        self.panel_color_edit.textChanged.connect(self.on_any_setting_changed)
-
-        btn_panel = QPushButton("Pick")
-        btn_panel.setFixedHeight(32)
-        btn_panel.setCursor(Qt.PointingHandCursor)
-        btn_panel.clicked.connect(
-            lambda _=False, e=self.panel_color_edit, key="tooltip_panel_color": self.open_color_dialog(
-                e, key
+        for label_txt, key, placeholder, attr in _COLOR_ROW_SPEC:
+            row = QHBoxLayout()
+            lbl = QLabel(label_txt)
+            lbl.setMinimumWidth(160)
+
+            edit = QLineEdit()
+            edit.setFixedHeight(32)
+            edit.setPlaceholderText(placeholder)
+            edit.setText(str(self.settings.get(key, DEFAULT_SETTINGS.get(key))))
+            edit.textChanged.connect(self.on_any_setting_changed)
+            setattr(self, attr, edit)
+
+            btn = QPushButton("Pick")
+            btn.setFixedHeight(32)
+            btn.setCursor(Qt.PointingHandCursor)
+            btn.clicked.connect(
+                lambda _=False, e=edit, k=key: self.open_color_dialog(e, k)
             )
-        )
 
-        panel_row.addWidget(lbl_panel)
-        panel_row.addWidget(self.panel_color_edit, stretch=1)
-        panel_row.addWidget(btn_panel)
-        card_layout.addLayout(panel_row)
-
-        # Primary text color
-        primary_row = QHBoxLayout()
-        lbl_primary = QLabel("Primary text color:")
-        lbl_primary.setMinimumWidth(160)
-
-        self.text_primary_color_edit = QLineEdit()
-        self.text_primary_color_edit.setFixedHeight(32)
-        self.text_primary_color_edit.setPlaceholderText(color_hint)
-        self.text_primary_color_edit.setText(
-            str(
-                self.settings.get(
-                    "tooltip_text_primary_color",
-                    DEFAULT_SETTINGS.get(
-                        "tooltip_text_primary_color", "#141414ff"
-                    ),
-                )
-            )
-        )
-        self.text_primary_color_edit.textChanged.connect(
-            self.on_any_setting_changed
-        )
-
-        btn_primary = QPushButton("Pick")
-        btn_primary.setFixedHeight(32)
-        btn_primary.setCursor(Qt.PointingHandCursor)
-        btn_primary.clicked.connect(
-            lambda _=False, e=self.text_primary_color_edit, key="tooltip_text_primary_color": self.open_color_dialog(
-                e, key
-            )
-        )
-
-        primary_row.addWidget(lbl_primary)
-        primary_row.addWidget(self.text_primary_color_edit, stretch=1)
-        primary_row.addWidget(btn_primary)
-        card_layout.addLayout(primary_row)
-
-        # Secondary text color
-        secondary_row = QHBoxLayout()
-        lbl_secondary = QLabel("Secondary text color:")
-        lbl_secondary.setMinimumWidth(160)
-
-        self.text_secondary_color_edit = QLineEdit()
-        self.text_secondary_color_edit.setFixedHeight(32)
-        self.text_secondary_color_edit.setPlaceholderText(color_hint)
-        self.text_secondary_color_edit.setText(
-            str(
-                self.settings.get(
-                    "tooltip_text_secondary_color",
-                    DEFAULT_SETTINGS.get(
-                        "tooltip_text_secondary_color", "#505050ff"
-                    ),
-                )
-            )
-        )
-        self.text_secondary_color_edit.textChanged.connect(
-            self.on_any_setting_changed
-        )
-
-        btn_secondary = QPushButton("Pick")
-        btn_secondary.setFixedHeight(32)
-        btn_secondary.setCursor(Qt.PointingHandCursor)
-        btn_secondary.clicked.connect(
-            lambda _=False, e=self.text_secondary_color_edit, key="tooltip_text_secondary_color": self.open_color_dialog(
-                e, key
-            )
-        )
-
-        secondary_row.addWidget(lbl_secondary)
-        secondary_row.addWidget(self.text_secondary_color_edit, stretch=1)
-        secondary_row.addWidget(btn_secondary)
-        card_layout.addLayout(secondary_row)
-
-        # KEEP color
-        keep_row = QHBoxLayout()
-        lbl_keep = QLabel("KEEP color:")
-        lbl_keep.setMinimumWidth(160)
-
-        self.keep_color_edit = QLineEdit()
-        self.keep_color_edit.setFixedHeight(32)
-        self.keep_color_edit.setPlaceholderText("#ff2828ff")
-        self.keep_color_edit.setText(
-            str(
-                self.settings.get(
-                    "tooltip_keep_color",
-                    DEFAULT_SETTINGS.get("tooltip_keep_color", "#ff2828ff"),
-                )
-            )
-        )
-        self.keep_color_edit.textChanged.connect(self.on_any_setting_changed)
-
-        btn_keep = QPushButton("Pick")
-        btn_keep.setFixedHeight(32)
-        btn_keep.setCursor(Qt.PointingHandCursor)
-        btn_keep.clicked.connect(
-            lambda _=False, e=self.keep_color_edit, key="tooltip_keep_color": self.open_color_dialog(
-                e, key
-            )
-        )
-
-        keep_row.addWidget(lbl_keep)
-        keep_row.addWidget(self.keep_color_edit, stretch=1)
-        keep_row.addWidget(btn_keep)
-        card_layout.addLayout(keep_row)
-
-        # RECYCLE color
-        recycle_row = QHBoxLayout()
-        lbl_recycle = QLabel("RECYCLE color:")
-        lbl_recycle.setMinimumWidth(160)
-
-        self.recycle_color_edit = QLineEdit()
-        self.recycle_color_edit.setFixedHeight(32)
-        self.recycle_color_edit.setPlaceholderText("#28ffffff")
-        self.recycle_color_edit.setText(
-            str(
-                self.settings.get(
-                    "tooltip_recycle_color",
-                    DEFAULT_SETTINGS.get("tooltip_recycle_color", "#28ffffff"),
-                )
-            )
-        )
-        self.recycle_color_edit.textChanged.connect(self.on_any_setting_changed)
-
-        btn_recycle = QPushButton("Pick")
-        btn_recycle.setFixedHeight(32)
-        btn_recycle.setCursor(Qt.PointingHandCursor)
-        btn_recycle.clicked.connect(
-            lambda _=False, e=self.recycle_color_edit, key="tooltip_recycle_color": self.open_color_dialog(
-                e, key
-            )
-        )
-
-        recycle_row.addWidget(lbl_recycle)
-        recycle_row.addWidget(self.recycle_color_edit, stretch=1)
-        recycle_row.addWidget(btn_recycle)
-        card_layout.addLayout(recycle_row)
-
-        # SELL color
-        sell_row = QHBoxLayout()
-        lbl_sell = QLabel("SELL color:")
-        lbl_sell.setMinimumWidth(160)
-
-        self.sell_color_edit = QLineEdit()
-        self.sell_color_edit.setFixedHeight(32)
-        self.sell_color_edit.setPlaceholderText("#28ff28ff")
-        self.sell_color_edit.setText(
-            str(
-                self.settings.get(
-                    "tooltip_sell_color",
-                    DEFAULT_SETTINGS.get("tooltip_sell_color", "#28ff28ff"),
-                )
-            )
-        )
-        self.sell_color_edit.textChanged.connect(self.on_any_setting_changed)
-
-        btn_sell = QPushButton("Pick")
-        btn_sell.setFixedHeight(32)
-        btn_sell.setCursor(Qt.PointingHandCursor)
-        btn_sell.clicked.connect(
-            lambda _=False, e=self.sell_color_edit, key="tooltip_sell_color": self.open_color_dialog(
-                e, key
-            )
-        )
-
-        sell_row.addWidget(lbl_sell)
-        sell_row.addWidget(self.sell_color_edit, stretch=1)
-        sell_row.addWidget(btn_sell)
-        card_layout.addLayout(sell_row)
+            row.addWidget(lbl)
+            row.addWidget(edit, stretch=1)
+            row.addWidget(btn)
+            card_layout.addLayout(row)
 
         # Always-on checkbox (still not added to layout, to preserve behavior)
         self.chk_always_on = QCheckBox("Always on")
         self.chk_always_on.setChecked(bool(self.settings.get("always_on", False)))
-        self.chk_always_on.setStyleSheet(
-            """
-            QCheckBox {
-                font-size: 13px;
-            }
-            """
-        )
+        self.chk_always_on.setObjectName("AlwaysOnCheck")
         self.chk_always_on.stateChanged.connect(self.on_any_setting_changed)
 
         # Note: not added to layout to keep behaviour identical
@@ -769,13 +807,16 @@ class SettingsWindow(QMainWindow):
             "The tooltip helper runs automatically in the background. "
             "Changes take effect immediately."
         )
-        footer.setStyleSheet("color: #9aa0a6; font-size: 11px;")
+        footer.setObjectName("Footer")
         footer.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
         main_layout.addWidget(footer)
 
-        self.start_helper_if_needed()
-
     def closeEvent(self, event):
+        # flush a pending debounced save so the last edit is not lost
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._save_current_settings()
+
         if self._allow_close:
             super().closeEvent(event)
         else:
@@ -905,76 +946,95 @@ class SettingsWindow(QMainWindow):
 
         # opacity
         if hasattr(self, "opacity_spin"):
-            try:
-                alpha_val = float(self.opacity_spin.value())
-            except (TypeError, ValueError):
-                alpha_val = DEFAULT_SETTINGS.get("tooltip_alpha", 0.94)
-            alpha_val = max(0.1, min(1.0, alpha_val))
-            self.settings["tooltip_alpha"] = alpha_val
-
-        # color helpers
-        def _read_color(edit_attr, setting_key, default_key):
-            edit = getattr(self, edit_attr, None)
+            self.settings["tooltip_alpha"] = _coerce_setting(
+                "tooltip_alpha", self.opacity_spin.value()
+            )
+
+        # colors; an empty field falls back to the default
+        for _label, key, _placeholder, attr in _COLOR_ROW_SPEC:
+            edit = getattr(self, attr, None)
             if edit is None:
-                return
-            txt = edit.text().strip()
-            if not txt:
-                txt = DEFAULT_SETTINGS.get(default_key, "")
-            self.settings[setting_key] = txt
-
-        _read_color("panel_color_edit", "tooltip_panel_color", "tooltip_panel_color")
-        _read_color(
-            "text_primary_color_edit",
-            "tooltip_text_primary_color",
-            "tooltip_text_primary_color",
-        )
-        _read_color(
-            "text_secondary_color_edit",
-            "tooltip_text_secondary_color",
-            "tooltip_text_secondary_color",
-        )
-        _read_color("keep_color_edit", "tooltip_keep_color", "tooltip_keep_color")
-        _read_color(
-            "recycle_color_edit",
-            "tooltip_recycle_color",
-            "tooltip_recycle_color",
-        )
-        _read_color("sell_color_edit", "tooltip_sell_color", "tooltip_sell_color")
+                continue
+            self.settings[key] = edit.text().strip() or DEFAULT_SETTINGS.get(key, "")
 
         try:
             save_settings(self.settings)
-            return True
         except Exception as e:
             self.hotkey_edit.setText(f"Error saving settings: {e}")
             return False
+        self.push_settings_to_helper()
+        return True
 
-    def on_any_setting_changed(self):
-        self._save_current_settings()
-
-    def start_helper_if_needed(self):
+    def push_settings_to_helper(self):
         """
-        Automatically start helper process if it's not running yet.
+        Send the current settings to the running helper over its stdin so it
+        can apply them without waiting for the settings file poll.
         """
-        if self.helper_process is not None and self.helper_process.poll() is None:
+        proc = self.helper_process
+        if proc is None or proc.stdin is None or proc.poll() is not None:
             return
-
-        script_path = os.path.abspath(sys.argv[0])
+        line = json.dumps({"type": "settings", "data": self.settings}) + "\n"
         try:
-            creation_flags = 0
-            if os.name == "nt":
-                creation_flags = subprocess.CREATE_NEW_PROCESS_GROUP
-
-            self.helper_process = subprocess.Popen(
-                [sys.executable, script_path, "--run-helper"],
-                creationflags=creation_flags,
-            )
-        except Exception as e:
+            proc.stdin.write(line.encode("utf-8"))
+            proc.stdin.flush()
+        except (OSError, ValueError):
             pass
-            # self.hotkey_edit.setText(f"Error starting helper: {e}")
-            # self.helper_process = None
+
+    def on_any_setting_changed(self):
+        # (re)start the debounce window; the timer performs the actual save
+        self._save_timer.start()
+
+
+def start_helper_process() -> subprocess.Popen | None:
+    """
+    Start the tooltip helper process. Returns None if it could not be started.
+    """
+    script_path = os.path.abspath(sys.argv[0])
+    try:
+        creation_flags = 0
+        if os.name == "nt":
+            creation_flags = subprocess.CREATE_NEW_PROCESS_GROUP
+
+        return subprocess.Popen(
+            [sys.executable, script_path, "--run-helper"],
+            stdin=subprocess.PIPE,
+            creationflags=creation_flags,
+        )
+    except Exception as e:
+        print(f"Error starting helper: {e}")
+        return None
+
+
+HELPER_SHUTDOWN_TIMEOUT = 2.0  # seconds to wait for a requested helper exit
 
 
+def stop_helper_process(proc: subprocess.Popen | None) -> None:
+    """
+    Ask the helper to exit over its stdin, so it can write pending verdict
+    overrides first, and terminate it if it does not exit in time.
+    terminate() alone is TerminateProcess on Windows: no cleanup runs.
+    """
+    if proc is None or proc.poll() is not None:
+        return
+    try:
+        if proc.stdin is not None:
+            proc.stdin.write(b'{"type": "shutdown"}\n')
+            proc.stdin.flush()
+        proc.wait(timeout=HELPER_SHUTDOWN_TIMEOUT)
+        return
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        pass
+    try:
+        proc.terminate()
+    except Exception:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
 def create_dark_palette() -> QPalette:
+    """
+    Dark palette for the settings UI. Built once; setPalette() copies it.
+    """
     palette = QPalette()
     palette.setColor(QPalette.Window, QColor("#171717"))
     palette.setColor(QPalette.WindowText, QColor("#e8eaed"))
@@ -1003,49 +1063,25 @@ def run_settings_ui():
 
     app.setQuitOnLastWindowClosed(False)
 
-    app.setStyleSheet(
-        """
-        QPushButton {
-            background-color: #3c4043;
-            color: #e8eaed;
-            border-radius: 6px;
-            padding: 6px 12px;
-            border: 1px solid #5f6368;
-            font-size: 12px;
-        }
-        QPushButton:hover {
-            background-color: #5f6368;
-        }
-        QPushButton:pressed {
-            background-color: #8ab4f8;
-            border-color: #8ab4f8;
-            color: #202124;
-        }
-        QCheckBox::indicator {
-            width: 16px;
-            height: 16px;
-        }
-        QCheckBox::indicator:unchecked {
-            border-radius: 3px;
-            border: 1px solid #5f6368;
-            background-color: #171717;
-        }
-        QCheckBox::indicator:checked {
-            border-radius: 3px;
-            border: 1px solid #8ab4f8;
-            background-color: #8ab4f8;
-        }
-        """
-    )
+    app.setStyleSheet(APP_QSS)
+
+    if not SETTINGS_PATH.is_file():
+        try:
+            save_settings(load_settings())
+        except Exception:
+            pass
+
+    # The helper is what runs all the time; the settings window is only
+    # built the first time the user opens it.
+    helper_process = start_helper_process()
 
     if not QSystemTrayIcon.isSystemTrayAvailable():
         print("System tray not available, running with normal window.")
-        window = SettingsWindow()
+        window = SettingsWindow(helper_process)
         window.show()
         sys.exit(app.exec())
 
-    window = SettingsWindow()
-    window.hide()
+    window: SettingsWindow | None = None
 
     tray = QSystemTrayIcon()
 
@@ -1066,6 +1102,9 @@ def run_settings_ui():
     tray.setContextMenu(menu)
 
     def show_settings():
+        nonlocal window
+        if window is None:
+            window = SettingsWindow(helper_process)
         if window.isMinimized():
             window.showNormal()
         if not window.isVisible():
@@ -1082,14 +1121,11 @@ def run_settings_ui():
     tray.activated.connect(on_tray_activated)
 
     def quit_app():
-        if window.helper_process is not None and window.helper_process.poll() is None:
-            try:
-                window.helper_process.terminate()
-            except Exception:
-                pass
+        stop_helper_process(helper_process)
 
-        window._allow_close = True
-        window.close()
+        if window is not None:
+            window._allow_close = True
+            window.close()
 
         tray.hide()
         app.quit()
@@ -1103,27 +1139,147 @@ def run_settings_ui():
 
 TESSDATA_PATH = r"tessdata"
 
-try:
-    import mss.windows as mss_win
+# Capture / OCR / overlay stack. Only the --run-helper process needs these, so
+# they are bound by load_helper_modules() instead of at import time; the
+# settings UI then starts with just PySide6 loaded.
+cv2 = None
+np = None
+mss = None
+mss_win = None
+tk = None
+Image = ImageDraw = ImageFont = ImageTk = None
+PyTessBaseAPI = PSM = None
 
-    mss_win.CAPTUREBLT = 0
-except Exception:
-    mss_win = None
 
-try:
-    response = requests.get("https://ghostworld073.pythonanywhere.com/arc_raiders_items")
-    if response.status_code == 200:
-        arc_raider_item_names = response.json()
-    else:
-        with open("arc_raiders_items.csv", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            arc_raider_item_names = list(reader)
-except Exception:
-    with open("arc_raiders_items.csv", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        arc_raider_item_names = list(reader)
+def load_helper_modules() -> None:
+    """
+    Import the heavy helper-only modules into the module namespace.
+    """
+    global cv2, np, mss, mss_win, tk, _PANEL_DETECT_UMAT
+    global Image, ImageDraw, ImageFont, ImageTk, PyTessBaseAPI, PSM
+
+    # Each OCR worker thread runs its own Tesseract instance; letting every
+    # one of them also fan out over OpenMP oversubscribes the CPU and slows
+    # recognition down. The runtime reads these once, so set them before
+    # anything that links OpenMP is imported.
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    os.environ.setdefault("OMP_NUM_THREADS", "1")
+
+    import cv2
+    import numpy as np
+    import tkinter as tk
+    from mss import mss
+    from PIL import Image, ImageDraw, ImageFont, ImageTk
+    from tesserocr import PyTessBaseAPI, PSM
+
+    try:
+        import mss.windows as mss_win
+
+        mss_win.CAPTUREBLT = 0
+    except Exception:
+        mss_win = None
+
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(0)
+
+    _PANEL_DETECT_UMAT = PANEL_DETECT_OPENCL and cv2.ocl.haveOpenCL()
+    cv2.ocl.setUseOpenCL(_PANEL_DETECT_UMAT)
+
+
+ITEMS_CSV_PATH = "arc_raiders_items.csv"
+ITEMS_CATALOG_URL = "https://ghostworld073.pythonanywhere.com/arc_raiders_items"
+# seconds; without a timeout a stalled connection hangs startup indefinitely
+ITEMS_CATALOG_TIMEOUT = 5
+ITEMS_CACHE_PATH = CONFIG_DIR / "arc_raiders_items.cache.json"
+ITEMS_CACHE_TTL = 60 * 60
+
+
+def load_items_csv(path: str = ITEMS_CSV_PATH) -> list[dict]:
+    """
+    Load the bundled item catalog as a list of row dicts (same shape as the
+    online catalog).
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        # like DictReader, but without its per-row bookkeeping; blank lines
+        # are skipped the same way
+        return [dict(zip(header, values)) for values in reader if values]
+
+
+def _read_items_cache(max_age: float | None) -> list[dict] | None:
+    """
+    Return the cached online catalog, or None if it is missing, unreadable
+    or older than `max_age` seconds (None = any age).
+    """
+    try:
+        if max_age is not None:
+            age = time.time() - ITEMS_CACHE_PATH.stat().st_mtime
+            if age > max_age:
+                return None
+        data = _json_loads(ITEMS_CACHE_PATH.read_bytes())
+    except Exception:
+        return None
+    return data if isinstance(data, list) else None
+
+
+def fetch_item_catalog() -> list[dict]:
+    """
+    Load the item catalog.
+
+    A cached copy of the online catalog younger than ITEMS_CACHE_TTL is used
+    as is. Otherwise the catalog is downloaded and the cache refreshed; if
+    that fails, a stale cache and then the bundled CSV are used.
+
+    This is the only network call the app makes, so requests is imported
+    here and a plain get() is used; a session would never be reused.
+    """
+    cached = _read_items_cache(ITEMS_CACHE_TTL)
+    if cached is not None:
+        return cached
+
+    try:
+        import requests
+
+        response = requests.get(ITEMS_CATALOG_URL, timeout=ITEMS_CATALOG_TIMEOUT)
+        if response.status_code == 200:
+            body = response.content
+            data = _json_loads(body)
+            if isinstance(data, list):
+                try:
+                    tmp_path = ITEMS_CACHE_PATH.with_suffix(".tmp")
+                    tmp_path.write_bytes(body)
+                    os.replace(tmp_path, ITEMS_CACHE_PATH)
+                except OSError:
+                    pass
+                return data
+    except Exception:
+        pass
+
+    cached = _read_items_cache(None)
+    if cached is not None:
+        return cached
+    return load_items_csv()
+
+
+# Filled by load_item_catalog_blocking(); the settings UI never needs the
+# catalog, so nothing is loaded at import time.
+arc_raider_item_names: list[dict] = []
+
+# set once arc_raider_item_names and the lookup tables are built
+_CATALOG_READY = threading.Event()
+_CATALOG_LOAD_LOCK = threading.Lock()
+# the exception that stopped the catalog load, if any
+_CATALOG_LOAD_ERROR: Exception | None = None
+# seconds a name lookup waits for a catalog that is still loading
+CATALOG_WAIT_TIMEOUT = 5
 
 ITEM_LOOKUP = {}
+ITEM_LOOKUP_KEYS: tuple[str, ...] = ()
+# Category per row of arc_raider_item_names (same indices as ITEM_ORDER values)
+ITEM_CATEGORIES: list[str] = []
+# character trigram -> indices into ITEM_LOOKUP_KEYS of keys containing it
+ITEM_TRIGRAM_INDEX: dict[str, set[int]] = {}
 ITEM_ORDER: dict[str, int] = {}
 
 
@@ -1146,8 +1302,7 @@ def load_user_verdicts() -> None:
         return
 
     try:
-        with open(VERDICTS_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _json_loads(VERDICTS_PATH.read_bytes())
     except Exception as e:
         print(f"[helper] Failed to load verdict overrides from {VERDICTS_PATH}: {e}")
         USER_VERDICTS = {}
@@ -1163,14 +1318,65 @@ def load_user_verdicts() -> None:
 def save_user_verdicts() -> None:
     """
     Save per-item verdict overrides to JSON.
+
+    The payload is serialized in one go and written to a temp file that
+    replaces the verdicts file, so a crash mid-write cannot truncate it.
     """
+    data = dict(USER_VERDICTS)  # snapshot; the hotkey thread may be editing it
     try:
-        with open(VERDICTS_PATH, "w", encoding="utf-8") as f:
-            json.dump(USER_VERDICTS, f, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode("utf-8")
+        tmp_path = VERDICTS_PATH.with_suffix(VERDICTS_PATH.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, VERDICTS_PATH)
     except Exception as e:
         print(f"[helper] Failed to save verdict overrides to {VERDICTS_PATH}: {e}")
 
 
+VERDICT_SAVE_DELAY = 0.3  # seconds of quiet before overrides are written
+
+_VERDICT_SAVE_LOCK = threading.Lock()
+_VERDICT_WRITE_LOCK = threading.Lock()
+_VERDICT_SAVE_TIMER: threading.Timer | None = None
+
+
+def schedule_verdict_save() -> None:
+    """
+    Save verdict overrides once the cycle hotkey has been idle for
+    VERDICT_SAVE_DELAY, on a background timer thread.
+    """
+    global _VERDICT_SAVE_TIMER
+    with _VERDICT_SAVE_LOCK:
+        if _VERDICT_SAVE_TIMER is not None:
+            _VERDICT_SAVE_TIMER.cancel()
+        _VERDICT_SAVE_TIMER = threading.Timer(VERDICT_SAVE_DELAY, flush_verdict_save)
+        _VERDICT_SAVE_TIMER.daemon = True
+        _VERDICT_SAVE_TIMER.start()
+
+
+def flush_verdict_save() -> None:
+    """
+    Write a pending verdict save now (no-op if nothing is pending).
+    """
+    global _VERDICT_SAVE_TIMER
+    with _VERDICT_SAVE_LOCK:
+        timer = _VERDICT_SAVE_TIMER
+        _VERDICT_SAVE_TIMER = None
+    if timer is None:
+        return
+    timer.cancel()
+    with _VERDICT_WRITE_LOCK:
+        save_user_verdicts()
+
+
+# covers normal interpreter exits (e.g. Ctrl+C in a console); the settings
+# UI stops the helper with a "shutdown" message instead, which flushes too
+atexit.register(flush_verdict_save)
+
+
 def get_effective_verdict(row, detected_name: str | None) -> str:
     """
     Return the verdict that should be shown for a row, taking the user
@@ -1212,11 +1418,42 @@ def cycle_verdict_for_current_item(direction: int = 1) -> None:
 
     new_verdict = VERDICT_CYCLE[idx]
     USER_VERDICTS[name] = new_verdict
-    save_user_verdicts()
+    schedule_verdict_save()
     TOOLTIP_NEEDS_REFRESH = True
     print(f"[helper] Override for '{name}' -> {new_verdict}")
 
 
+_TRAILING_NUMBER_RE = re.compile(r"(\b[IVXLCDM]+\b|\b\d+\b)$", re.IGNORECASE)
+
+ROMAN_SUFFIXES: tuple[str, ...] = ("I", "II", "III", "IV")
+ROMAN_ORDER = {r: i for i, r in enumerate(ROMAN_SUFFIXES)}
+
+# Every spelling OCR / the catalog may use for I-IV ("l", "|", any case),
+# mapped to the canonical numeral and to its digit.
+_ROMAN_I_LOOKALIKES = "IiLl|"
+_ROMAN_CANONICAL = {
+    "".join(spelling): roman
+    for roman in ROMAN_SUFFIXES
+    for spelling in itertools.product(
+        *[_ROMAN_I_LOOKALIKES if ch == "I" else "Vv" for ch in roman]
+    )
+}
+_ROMAN_TO_DIGIT = {
+    spelling: str(ROMAN_ORDER[roman] + 1) for spelling, roman in _ROMAN_CANONICAL.items()
+}
+# very short names only get 0 -> o; longer ones also fold I/|/1 -> l
+_TRANS_SHORT = str.maketrans({"0": "o"})
+_TRANS_LONG = str.maketrans(
+    {
+        "I": "l",
+        "|": "l",
+        "1": "l",
+        "0": "o",
+    }
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_name_for_match(name: str) -> str:
     """
     Normalize strings so OCR quirks (I vs l, 0 vs O, etc.) still match.
@@ -1231,59 +1468,85 @@ def normalize_name_for_match(name: str) -> str:
     s = safe_str(name).strip()
 
     if s:
-        m = re.search(r"(\b[IVXLCDM]+\b|\b\d+\b)$", s, re.IGNORECASE)
+        m = _TRAILING_NUMBER_RE.search(s)
         if m:
             token = m.group(1)
-            token_clean = token.upper().replace("|", "I").replace("L", "I")
-
-            roman_map = {
-                "I": "1",
-                "II": "2",
-                "III": "3",
-                "IV": "4",
-            }
 
-            digit = None
-            if token_clean in roman_map:
-                digit = roman_map[token_clean]
-            elif token_clean.isdigit():
-                digit = token_clean
+            digit = _ROMAN_TO_DIGIT.get(token)
+            if digit is None and token.isdigit():
+                digit = token
 
             if digit is not None:
                 s = s[: m.start(1)] + digit
 
-    core = re.sub(r"\s+", "", s)
-    if len(core) <= 3:
-        trans = str.maketrans(
-            {
-                "0": "o",
-            }
-        )
-    else:
-        trans = str.maketrans(
-            {
-                "I": "l",
-                "|": "l",
-                "1": "l",
-                "0": "o",
-            }
-        )
+    # one split() serves both the short-name check and whitespace collapsing
+    words = s.split()
+    trans = _TRANS_SHORT if sum(map(len, words)) <= 3 else _TRANS_LONG
+
+    return " ".join(words).translate(trans).lower()
+
+
+# lru caches whose results depend on the loaded catalog (ITEM_LOOKUP,
+# ITEM_ORDER, categories); build_item_lookup() clears them
+_CATALOG_CACHES: list = []
+
+
+def _catalog_cache(maxsize: int):
+    """
+    lru_cache that is registered for invalidation by build_item_lookup().
+    """
+    def decorator(func):
+        cached = functools.lru_cache(maxsize=maxsize)(func)
+        _CATALOG_CACHES.append(cached)
+        return cached
+
+    return decorator
+
 
-    s = s.translate(trans).lower()
+def _trigrams(s: str) -> set[str]:
+    return {s[i:i + 3] for i in range(len(s) - 2)}
 
-    s = re.sub(r"\s+", " ", s)
-    return s
+
+def _keys_containing_tokens(tokens: list[str]) -> list[str]:
+    """
+    Keys (in ITEM_LOOKUP_KEYS order) that contain every token as a substring.
+
+    Tokens must be at least 3 characters. The trigram index narrows the
+    search to keys that contain all of the tokens' trigrams; the substring
+    test is then only run on those.
+    """
+    postings = []
+    for t in tokens:
+        for gram in _trigrams(t):
+            posting = ITEM_TRIGRAM_INDEX.get(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+
+    keys = ITEM_LOOKUP_KEYS
+    return [
+        keys[pos]
+        for pos in sorted(set.intersection(*postings))
+        if all(t in keys[pos] for t in tokens)
+    ]
 
 
 def build_item_lookup():
     """
     Build:
       - ITEM_LOOKUP: normalized name -> row
+      - ITEM_LOOKUP_KEYS: the normalized names, as a tuple for fuzzy matching
+      - ITEM_TRIGRAM_INDEX: trigram -> positions in ITEM_LOOKUP_KEYS
       - ITEM_ORDER:  normalized name -> index in arc_raider_item_names
+      - ITEM_CATEGORIES: Category of each row in arc_raider_item_names
     """
-    global ITEM_LOOKUP, ITEM_ORDER
-    ITEM_LOOKUP = {}
-    ITEM_ORDER = {}
+    global ITEM_LOOKUP, ITEM_LOOKUP_KEYS, ITEM_TRIGRAM_INDEX, ITEM_ORDER
+    global ITEM_CATEGORIES
+    # built in locals and published together, so a reader on another
+    # thread never sees half-filled tables
+    lookup = {}
+    order = {}
+    categories = [safe_str(row.get("Category", "")) for row in arc_raider_item_names]
 
     for idx, row in enumerate(arc_raider_item_names):
         name = str(row.get("Name", "")).strip()
@@ -1293,13 +1556,39 @@ def build_item_lookup():
         norm = normalize_name_for_match(name)
 
         # For lookup, keep the last row as before
-        ITEM_LOOKUP[norm] = row
+        lookup[norm] = row
 
         # For ordering, remember the first occurrence
-        if norm not in ITEM_ORDER:
-            ITEM_ORDER[norm] = idx
+        if norm not in order:
+            order[norm] = idx
+
+    keys = tuple(lookup)
+
+    trigram_index = {}
+    for pos, key in enumerate(keys):
+        for gram in _trigrams(key):
+            trigram_index.setdefault(gram, set()).add(pos)
+
+    ITEM_LOOKUP_KEYS = keys
+    ITEM_TRIGRAM_INDEX = trigram_index
+    ITEM_ORDER = order
+    ITEM_CATEGORIES = categories
+    ITEM_LOOKUP = lookup
+
+    for cached in _CATALOG_CACHES:
+        cached.cache_clear()
+
+
+def get_item_category(idx: int | None) -> str:
+    """
+    Return the Category of the catalog row at `idx`, or "" if out of range.
+    """
+    if idx is None or not 0 <= idx < len(ITEM_CATEGORIES):
+        return ""
+    return ITEM_CATEGORIES[idx]
 
 
+@_catalog_cache(maxsize=4096)
 def get_csv_index_for_name(name: str) -> int | None:
     """
     Return the index of an item in the original CSV, or None if not found.
@@ -1309,15 +1598,82 @@ def get_csv_index_for_name(name: str) -> int | None:
     return ITEM_ORDER.get(norm)
 
 
-build_item_lookup()
+def _load_item_catalog():
+    """
+    Fetch the item catalog and build the lookup tables, once. A failure is
+    kept in _CATALOG_LOAD_ERROR; _CATALOG_READY is set either way, so no
+    waiter is left hanging.
+    """
+    global arc_raider_item_names, _CATALOG_LOAD_ERROR
+    with _CATALOG_LOAD_LOCK:
+        if _CATALOG_READY.is_set():
+            return
+        try:
+            arc_raider_item_names = fetch_item_catalog()
+            build_item_lookup()
+        except Exception as e:
+            _CATALOG_LOAD_ERROR = e
+        finally:
+            _CATALOG_READY.set()
+
+
+def load_item_catalog_blocking():
+    """
+    Load the item catalog (or wait for a load already in progress) and
+    raise if it could not be loaded.
+    """
+    _load_item_catalog()
+    if _CATALOG_LOAD_ERROR is not None:
+        raise RuntimeError("Item catalog could not be loaded") from _CATALOG_LOAD_ERROR
+
+
+def start_item_catalog_load():
+    """
+    Load the item catalog on a daemon thread; run_helper collects the
+    result through load_item_catalog_blocking().
+    """
+    threading.Thread(target=_load_item_catalog, daemon=True).start()
+
+
+def _best_ratio_match(norm: str, candidates: list[str]) -> tuple[str, float]:
+    """
+    Return the candidate most similar to `norm` and its ratio (0..1).
+
+    Uses rapidfuzz's C implementation when available, difflib otherwise.
+    Ties go to the earliest candidate either way.
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        best_key, score, _ = rf_process.extractOne(norm, candidates, scorer=rf_fuzz.ratio)
+        return best_key, score / 100.0
+
+    # norm is fixed as seq2, so difflib builds its b2j index (and the
+    # quick_ratio character counts) once; the cheap upper bounds skip any
+    # candidate that cannot beat the best ratio so far
+    sm = difflib.SequenceMatcher(None, "", norm)
+    best_key, best_ratio = candidates[0], -1.0
+    for k in candidates:
+        sm.set_seq1(k)
+        if sm.real_quick_ratio() <= best_ratio or sm.quick_ratio() <= best_ratio:
+            continue
+        ratio = sm.ratio()
+        if ratio > best_ratio:
+            best_key, best_ratio = k, ratio
+    return best_key, best_ratio
 
 
 def find_item_row_by_name(name: str):
+    if not _CATALOG_READY.is_set():
+        _CATALOG_READY.wait(CATALOG_WAIT_TIMEOUT)
+    return _find_item_row_by_name(name)
+
+
+@_catalog_cache(maxsize=1024)
+def _find_item_row_by_name(name: str):
     if not name or not ITEM_LOOKUP:
         return None
 
     norm = normalize_name_for_match(name)
-    keys = list(ITEM_LOOKUP.keys())
+    keys = ITEM_LOOKUP_KEYS
 
     if norm in ITEM_LOOKUP:
         return ITEM_LOOKUP[norm]
@@ -1325,26 +1681,26 @@ def find_item_row_by_name(name: str):
     tokens = [t for t in norm.split() if len(t) >= 3]
 
     if tokens:
-        strict_candidates = [k for k in keys if all(t in k for t in tokens)]
+        strict_candidates = _keys_containing_tokens(tokens)
         if strict_candidates:
-            best_key = max(
-                strict_candidates,
-                key=lambda k: difflib.SequenceMatcher(None, norm, k).ratio(),
-            )
-            ratio = difflib.SequenceMatcher(None, norm, best_key).ratio()
+            best_key, ratio = _best_ratio_match(norm, strict_candidates)
             if ratio >= 0.6:
                 return ITEM_LOOKUP[best_key]
 
     partial_candidates = [k for k in keys if norm in k or k in norm]
     if partial_candidates:
-        best_key = max(
-            partial_candidates,
-            key=lambda k: difflib.SequenceMatcher(None, norm, k).ratio(),
-        )
-        ratio = difflib.SequenceMatcher(None, norm, best_key).ratio()
+        best_key, ratio = _best_ratio_match(norm, partial_candidates)
         if ratio >= 0.70:
             return ITEM_LOOKUP[best_key]
 
+    if RAPIDFUZZ_AVAILABLE:
+        best = rf_process.extractOne(
+            norm, keys, scorer=rf_fuzz.ratio, score_cutoff=70
+        )
+        if best:
+            return ITEM_LOOKUP[best[0]]
+        return None
+
     best = difflib.get_close_matches(norm, keys, n=1, cutoff=0.70)
     if best:
         return ITEM_LOOKUP[best[0]]
@@ -1373,6 +1729,25 @@ def format_percentage(value):
     return f"{sign}{v:.1f}%"
 
 
+_NUMERIC_SUFFIX_RE = re.compile(r"^(.*\D)(\d+)$")
+_QTY_PREFIX_RE = re.compile(r"^\s*(\d+)\s*[x×]\s*(.+)$")
+
+
+def _rr_sort_key(category, count, line: str) -> tuple:
+    """
+    Sort key for Reverse Recycle lines:
+      1) Known categories before unknown
+      2) "Loot" category first among known categories
+      3) Category name (alphabetically)
+      4) Amount (descending)
+      5) Line text (alphabetically)
+    """
+    cat_norm = (category or "").strip().lower()
+    is_unknown = 1 if not cat_norm else 0
+    loot_priority = 0 if cat_norm == "loot" else 1
+    return (is_unknown, loot_priority, cat_norm, -int(count or 0), line.lower())
+
+
 def parse_reverse_recycle(row):
     """
     Parse the 'Reverse Recycle' column.
@@ -1385,11 +1760,16 @@ def parse_reverse_recycle(row):
         3) Line text (alphabetically)
     """
     raw = safe_str(row.get("Reverse Recycle", "")).strip()
+    return list(_parse_reverse_recycle_cached(raw))
+
+
+@_catalog_cache(maxsize=2048)
+def _parse_reverse_recycle_cached(raw: str):
     if not raw or raw == "[]":
         return []
 
     try:
-        data = json.loads(raw)
+        data = _json_loads(raw)
     except Exception:
         # Fallback: just show the raw content
         return [raw]
@@ -1413,14 +1793,7 @@ def parse_reverse_recycle(row):
         item_name = safe_str(item).strip()
         idx = get_csv_index_for_name(item_name)
 
-        category = ""
-        if idx is not None and 0 <= idx < len(arc_raider_item_names):
-            try:
-                category = safe_str(
-                    arc_raider_item_names[idx].get("Category", "")
-                )
-            except Exception:
-                category = ""
+        category = get_item_category(idx)
 
         item_entries.append(
             {
@@ -1435,21 +1808,18 @@ def parse_reverse_recycle(row):
         return []
 
     # --- Group items that end with a trailing number: "Anvil 1", "Anvil 2", ...
-    suffix_re = re.compile(r"^(.*\D)(\d+)$")
-
-    numeric_groups: dict[str, dict] = {}
+    numeric_groups: dict[str, dict] = defaultdict(lambda: {"base": None, "entries": []})
     no_suffix_entries: list[dict] = []
 
     for ent in item_entries:
         name = ent["name"]
-        m = suffix_re.match(name)
+        m = _NUMERIC_SUFFIX_RE.match(name)
         if m:
             base = m.group(1).strip()  # "Anvil"
             key = base.lower()
-            g = numeric_groups.get(key)
-            if g is None:
-                g = {"base": base, "entries": []}
-                numeric_groups[key] = g
+            g = numeric_groups[key]
+            if not g["entries"]:
+                g["base"] = base
             g["entries"].append(ent)
         else:
             no_suffix_entries.append(ent)
@@ -1490,12 +1860,12 @@ def parse_reverse_recycle(row):
                 cat = e["category"]
                 break
 
+        line = f"{count_text} {base_name}"
         groups_out.append(
             {
-                "line": f"{count_text} {base_name}",
+                "line": line,
                 "index": group_index,
-                "count_key": max_c,
-                "category": cat,
+                "sort_key": _rr_sort_key(cat, max_c, line),
             }
         )
 
@@ -1515,30 +1885,36 @@ def parse_reverse_recycle(row):
             {
                 "line": line,
                 "index": idx,
-                "count_key": c,
-                "category": cat,
+                "sort_key": _rr_sort_key(cat, c, line),
             }
         )
 
-    # Sort by:
-    #   1) Known categories before unknown
-    #   2) "Loot" category first among known categories
-    #   3) Category name (alphabetically)
-    #   4) Amount (descending)
-    #   5) Line text (alphabetically)
-    def sort_key(g: dict):
-        cat = (g.get("category") or "").strip()
-        is_unknown = 1 if not cat else 0
-        cat_norm = cat.lower()
+    groups_out.sort(key=operator.itemgetter("sort_key"))
 
-        loot_priority = 0 if cat_norm == "loot" else 1
+    return [g["line"] for g in groups_out]
 
-        count_val = int(g.get("count_key", 0) or 0)
-        return (is_unknown, loot_priority, cat_norm, -count_val, g["line"].lower())
 
-    groups_out.sort(key=sort_key)
+def _parse_crafting_literal(raw: str):
+    """
+    Decode a raw 'Crafting' cell: JSON first, then a Python list literal.
 
-    return [g["line"] for g in groups_out]
+    Returns None if neither works. Only called from _parse_crafting_cached,
+    whose cache already covers repeat renders.
+    """
+    try:
+        data = _json_loads(raw)
+    except Exception:
+        data = None
+
+    if data is None:
+        try:
+            lit = ast.literal_eval(raw)
+        except Exception:
+            lit = None
+        if isinstance(lit, (list, tuple)):
+            data = lit
+
+    return data
 
 
 def parse_crafting(row, return_meta: bool = False):
@@ -1559,27 +1935,17 @@ def parse_crafting(row, return_meta: bool = False):
     - Sorted primarily by CSV index (ITEM_ORDER), unknown items last.
     """
     raw = safe_str(row.get("Crafting", "")).strip()
-    if not raw or raw == "[]":
-        return [] if not return_meta else []
+    return list(_parse_crafting_cached(raw, return_meta))
 
-    data = None
 
-    # 1) Try JSON first
-    try:
-        data = json.loads(raw)
-    except Exception:
-        data = None
+@_catalog_cache(maxsize=2048)
+def _parse_crafting_cached(raw: str, return_meta: bool):
+    if not raw or raw == "[]":
+        return [] if not return_meta else []
 
-    # 2) Try Python list literal if JSON failed
-    if data is None:
-        try:
-            lit = ast.literal_eval(raw)
-        except Exception:
-            lit = None
-        if isinstance(lit, (list, tuple)):
-            data = lit
+    data = _parse_crafting_literal(raw)
 
-    # 3) Fallback: comma-separated list or raw string
+    # Fallback: comma-separated list or raw string
     if data is None:
         parts = [p.strip() for p in raw.split(",") if p.strip()]
         if not return_meta:
@@ -1590,14 +1956,7 @@ def parse_crafting(row, return_meta: bool = False):
             out_meta = []
             for p in parts:
                 idx = get_csv_index_for_name(p)
-                category = ""
-                if idx is not None and 0 <= idx < len(arc_raider_item_names):
-                    try:
-                        category = safe_str(
-                            arc_raider_item_names[idx].get("Category", "")
-                        )
-                    except Exception:
-                        category = ""
+                category = get_item_category(idx)
                 out_meta.append(
                     {
                         "line": p,
@@ -1628,14 +1987,13 @@ def parse_crafting(row, return_meta: bool = False):
         item_name = safe_str(item).strip()
         idx = get_csv_index_for_name(item_name)
 
-        category = ""
-        if idx is not None and 0 <= idx < len(arc_raider_item_names):
-            try:
-                category = safe_str(
-                    arc_raider_item_names[idx].get("Category", "")
-                )
-            except Exception:
-                category = ""
+        category = get_item_category(idx)
+
+        if idx is None:
+            # Unknown index -> after known ones, by descending count then name
+            sort_key = (10**9, -int(c or 0), item_name.lower())
+        else:
+            sort_key = (idx, 0, item_name.lower())
 
         entries.append(
             {
@@ -1643,20 +2001,14 @@ def parse_crafting(row, return_meta: bool = False):
                 "count": c,
                 "index": idx,
                 "category": category,
+                "sort_key": sort_key,
             }
         )
 
     if not entries:
         return [] if not return_meta else []
 
-    def sort_key(e: dict):
-        idx = e["index"]
-        if idx is None:
-            # Unknown index -> after known ones, by descending count then name
-            return (10**9, -int(e["count"] or 0), e["name"].lower())
-        return (idx, 0, e["name"].lower())
-
-    entries.sort(key=sort_key)
+    entries.sort(key=operator.itemgetter("sort_key"))
 
     lines: list[str] = []
     meta_out: list[dict] = []
@@ -1682,10 +2034,6 @@ def parse_crafting(row, return_meta: bool = False):
     return meta_out if return_meta else lines
 
 
-ROMAN_SUFFIXES: tuple[str, ...] = ("I", "II", "III", "IV")
-ROMAN_ORDER = {r: i for i, r in enumerate(ROMAN_SUFFIXES)}
-
-
 def condense_roman_variants(lines: list[str], drop_suffix: bool = False) -> list[str]:
     """
     Group lines that differ only by a trailing roman numeral (I–IV) into
@@ -1697,7 +2045,9 @@ def condense_roman_variants(lines: list[str], drop_suffix: bool = False) -> list
     If drop_suffix=True, the condensed line omits the roman numerals entirely,
     e.g. 'Anvil' or '3x Anvil'.
     """
-    groups: dict[tuple[str, str], dict] = {}
+    groups: dict[tuple[str, str], dict] = defaultdict(
+        lambda: {"base": None, "qty": None, "romans": [], "first_index": None}
+    )
     passthrough: list[tuple[int, str]] = []
 
     for idx, original in enumerate(lines):
@@ -1705,7 +2055,7 @@ def condense_roman_variants(lines: list[str], drop_suffix: bool = False) -> list
         if not line:
             continue
 
-        m = re.match(r"^\s*(\d+)\s*[x×]\s*(.+)$", line)
+        m = _QTY_PREFIX_RE.match(line)
         if m:
             qty_str = m.group(1)
             rest = m.group(2).strip()
@@ -1716,20 +2066,19 @@ def condense_roman_variants(lines: list[str], drop_suffix: bool = False) -> list
         rest_no_punct = rest.rstrip(",.;: ")
         tokens = rest_no_punct.split()
         if len(tokens) >= 2:
-            last = tokens[-1]
-            last_norm = last.upper().replace("|", "I").replace("L", "I")
-            if last_norm in ROMAN_SUFFIXES:
+            last_norm = _ROMAN_CANONICAL.get(tokens[-1])
+            if last_norm is not None:
                 base = " ".join(tokens[:-1])
                 roman = last_norm
 
                 key = (base.lower(), qty_str or "")
-                g = groups.get(key)
-                if g is None:
-                    g = {"base": base, "qty": qty_str, "romans": [roman], "first_index": idx}
-                    groups[key] = g
-                else:
-                    if roman not in g["romans"]:
-                        g["romans"].append(roman)
+                g = groups[key]
+                if g["first_index"] is None:
+                    g["base"] = base
+                    g["qty"] = qty_str
+                    g["first_index"] = idx
+                if roman not in g["romans"]:
+                    g["romans"].append(roman)
                 continue
 
         passthrough.append((idx, original))
@@ -1766,7 +2115,9 @@ def condense_numeric_suffixes_for_crafting(lines: list[str]) -> list[str]:
     Lines that differ only by a trailing integer on the item name
     (e.g. 'Vulcano 1', 'Vulcano 3') are grouped into a single base name.
     """
-    groups: dict[str, dict] = {}
+    groups: dict[str, dict] = defaultdict(
+        lambda: {"base": None, "entries": [], "first_index": None}
+    )
     passthrough: list[tuple[int, str]] = []
 
     for idx, original in enumerate(lines):
@@ -1774,7 +2125,7 @@ def condense_numeric_suffixes_for_crafting(lines: list[str]) -> list[str]:
         if not line:
             continue
 
-        m_qty = re.match(r"^\s*(\d+)\s*[x×]\s*(.+)$", line)
+        m_qty = _QTY_PREFIX_RE.match(line)
         if m_qty:
             qty_str = m_qty.group(1)
             rest = m_qty.group(2).strip()
@@ -1786,7 +2137,8 @@ def condense_numeric_suffixes_for_crafting(lines: list[str]) -> list[str]:
             qty = 0
             rest = line
 
-        m_suffix = re.match(r"^(.*\D)(\d+)$", rest)
+        # most lines have no numeric suffix; skip the regex for them
+        m_suffix = _NUMERIC_SUFFIX_RE.match(rest) if rest[-1:].isdigit() else None
         if not m_suffix:
             passthrough.append((idx, original))
             continue
@@ -1795,12 +2147,11 @@ def condense_numeric_suffixes_for_crafting(lines: list[str]) -> list[str]:
         number = int(m_suffix.group(2))
 
         key = base.lower()
-        g = groups.get(key)
-        if g is None:
-            g = {"base": base, "entries": [], "first_index": idx}
-            groups[key] = g
+        g = groups[key]
+        if g["first_index"] is None:
+            g["base"] = base
+            g["first_index"] = idx
         g["entries"].append({"qty": qty, "suffix": number})
-        g["first_index"] = min(g["first_index"], idx)
 
     out_entries: list[tuple[int, str]] = []
 
@@ -1837,11 +2188,16 @@ def condense_numeric_suffixes_for_crafting(lines: list[str]) -> list[str]:
 
 def parse_workshop_requirements(row):
     raw = safe_str(row.get("Workshop Requirement", "")).strip()
+    return list(_parse_workshop_requirements_cached(raw))
+
+
+@_catalog_cache(maxsize=2048)
+def _parse_workshop_requirements_cached(raw: str):
     if not raw or raw == "[]":
         return []
 
     try:
-        data = json.loads(raw)
+        data = _json_loads(raw)
     except Exception:
         return [raw]
 
@@ -1860,8 +2216,19 @@ def parse_workshop_requirements(row):
     return lines
 
 
+_KEEP_COUNT_X_RE = re.compile(r"(\d+)\s*[x×]\s*(Expedition[s]?|Scrappy)", re.IGNORECASE)
+_KEEP_COUNT_SPACE_RE = re.compile(r"(\d+)\s+(Expedition[s]?|Scrappy)", re.IGNORECASE)
+_EXPEDITION_RE = re.compile(r"Expedition", re.IGNORECASE)
+_SCRAPPY_RE = re.compile(r"Scrappy", re.IGNORECASE)
+
+
 def parse_keep_for_quests_workshop(row):
     raw = safe_str(row.get("Keep for Quests/Workshop", "")).strip()
+    return list(_parse_keep_for_quests_workshop_cached(raw))
+
+
+@_catalog_cache(maxsize=2048)
+def _parse_keep_for_quests_workshop_cached(raw: str):
     if not raw:
         return []
 
@@ -1877,21 +2244,19 @@ def parse_keep_for_quests_workshop(row):
             return "Scrappy"
         return name
 
-    pattern = re.compile(r"(\d+)\s*[x×]\s*(Expedition[s]?|Scrappy)", re.IGNORECASE)
-    for count, item in pattern.findall(s):
+    for count, item in _KEEP_COUNT_X_RE.findall(s):
         normalized = normalize_item_name(item)
         bullets.append(f"{count}x {normalized}")
 
     if not bullets:
-        pattern2 = re.compile(r"(\d+)\s+(Expedition[s]?|Scrappy)", re.IGNORECASE)
-        for count, item in pattern2.findall(s):
+        for count, item in _KEEP_COUNT_SPACE_RE.findall(s):
             normalized = normalize_item_name(item)
             bullets.append(f"{count}x {normalized}")
 
     if not bullets:
-        if re.search(r"Expedition", s, re.IGNORECASE):
+        if _EXPEDITION_RE.search(s):
             bullets.append("Expedition")
-        if re.search(r"Scrappy", s, re.IGNORECASE):
+        if _SCRAPPY_RE.search(s):
             bullets.append("Scrappy")
 
     return bullets
@@ -1899,11 +2264,16 @@ def parse_keep_for_quests_workshop(row):
 
 def parse_quest_usage(row):
     raw = safe_str(row.get("Quest Usage", "")).strip()
+    return list(_parse_quest_usage_cached(raw))
+
+
+@_catalog_cache(maxsize=2048)
+def _parse_quest_usage_cached(raw: str):
     if not raw or raw == "[]":
         return []
 
     try:
-        data = json.loads(raw)
+        data = _json_loads(raw)
     except Exception:
         return [raw]
 
@@ -1922,6 +2292,16 @@ def parse_quest_usage(row):
 ROI_REL = (0.06, 0.04, 0.94, 0.92)
 
 DETECTION_INTERVAL = 0.10
+# seconds between checks of the settings file for hand edits
+SETTINGS_STAT_INTERVAL = 1.0
+# While the captured screen stays identical (and no OCR is pending) the
+# detection interval doubles after DETECTION_IDLE_TICKS ticks, up to this.
+DETECTION_IDLE_INTERVAL_MAX = 0.30
+DETECTION_IDLE_TICKS = 5
+# pixel stride of the frame fingerprint used to notice an unchanged screen
+FRAME_FINGERPRINT_STRIDE = 16
+# pixel stride of the name-ROI sample that short-circuits an unchanged name
+NAME_ROI_SAMPLE_STRIDE = 4
 MISSING_FRAMES_BEFORE_HIDE = 2
 
 REF_W = 1920
@@ -1940,38 +2320,114 @@ NAME_REF_H2 = 90
 HELPER_GAP_X_REF = 4
 HELPER_GAP_Y_REF = 46
 
-cv2.setUseOptimized(True)
-cv2.setNumThreads(0)
-
 COMPACT_MAX_WIDTH = 260
 COMPACT_PADDING = 14
 COMPACT_LINE_GAP = 8
 
 OCR_MIN_INTERVAL = 0.35
-LAST_OCR_TIME = 0.0
+LAST_OCR_TIME = float("-inf")
+
+# One PyTessBaseAPI per OCR thread (Tesseract instances are not thread-safe)
+_OCR_LOCAL = threading.local()
+OCR_WORKER_COUNT = 2
+
+# Otsu is used unless its foreground covers less than this fraction (or more
+# than 1 - this) of the ROI, which means lighting is too uneven for a global
+# threshold; an adaptive threshold is used then.
+OCR_OTSU_MIN_FILL = 0.02
+
+# ROI height (px) the name region is scaled to before OCR
+OCR_TARGET_HEIGHT = 40
+
+class LatestTaskSlot:
+    """
+    Single-slot handoff from the capture loop to the OCR workers.
+
+    put() replaces any task no worker has picked up yet, so a moving cursor
+    never leaves a backlog of stale ROIs and the newest one is always the
+    next to be read.
+    """
 
-OCR_API = None
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._task = None
+        self._closed = False
+
+    def put(self, task) -> None:
+        with self._lock:
+            self._task = task
+            self._ready.set()
+
+    def get(self):
+        """
+        Block until a task is available and take it; None once closed.
+        """
+        while True:
+            self._ready.wait()
+            with self._lock:
+                if self._closed:
+                    return None
+                task = self._task
+                self._task = None
+                self._ready.clear()
+            if task is not None:
+                return task
 
-ocr_task_queue = queue.Queue(maxsize=4)
+    def close(self) -> None:
+        """
+        Wake every waiting worker; get() returns None from now on.
+        """
+        with self._lock:
+            self._closed = True
+            self._ready.set()
+
+
+ocr_task_slot = LatestTaskSlot()
 ocr_result_queue = queue.Queue()
 
+# name ROI hash -> (name, row, secondary_used) of recent OCR results, so
+# hovering back over an item skips Tesseract; shared by the OCR workers
+OCR_RESULT_CACHE: OrderedDict = OrderedDict()
+OCR_RESULT_CACHE_SIZE = 64
+_OCR_RESULT_CACHE_LOCK = threading.Lock()
+
 HELPER_SCREEN_RECT = None
 
+# Panel detection runs on the frame shrunk by this integer factor; the panel
+# is large enough that the box only loses a pixel or two of precision.
+PANEL_DETECT_SCALE = 2
+
+# lowest HSV value (brightness) of the tooltip panel's background color
+PANEL_V_MIN = 200
+
+# Run the color mask and opening through OpenCV's transparent API (UMat) so
+# an OpenCL device can take them. Off by default: on many iGPUs the upload
+# and readback cost more than the CPU path saves. Only honoured when OpenCL
+# is actually available (see load_helper_modules).
+PANEL_DETECT_OPENCL = False
+_PANEL_DETECT_UMAT = False
+
 
 def init_ocr():
-    global OCR_API
-    if OCR_API is None:
-        OCR_API = PyTessBaseAPI(
+    """
+    Return the calling thread's Tesseract API, creating it on first use.
+    """
+    api = getattr(_OCR_LOCAL, "api", None)
+    if api is None:
+        api = PyTessBaseAPI(
             path=TESSDATA_PATH,
             lang="eng",
             psm=PSM.SINGLE_BLOCK,
         )
-        OCR_API.SetVariable(
+        api.SetVariable(
             "tessedit_char_whitelist",
             "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789 ",
         )
-        OCR_API.SetVariable("load_system_dawg", "F")
-        OCR_API.SetVariable("load_freq_dawg", "F")
+        api.SetVariable("load_system_dawg", "F")
+        api.SetVariable("load_freq_dawg", "F")
+        _OCR_LOCAL.api = api
+    return api
 
 
 def find_tooltip_panel_by_color(
@@ -1979,57 +2435,101 @@ def find_tooltip_panel_by_color(
 ):
     global HELPER_SCREEN_RECT
 
-    hsv = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2HSV)
-
-    lower = np.array([10, 5, 200], dtype=np.uint8)
-    upper = np.array([30, 80, 255], dtype=np.uint8)
-
-    mask = cv2.inRange(hsv, lower, upper)
+    full_h, full_w = frame_bgr.shape[:2]
+    scale = PANEL_DETECT_SCALE
+    small = frame_bgr
+    if scale > 1:
+        # INTER_AREA averages whole blocks, so unlike pyrDown's Gaussian it
+        # does not bleed the dark background into the panel's edge pixels
+        small = cv2.resize(
+            frame_bgr, (full_w // scale, full_h // scale), interpolation=cv2.INTER_AREA
+        )
+    min_area = min_area / (scale * scale)
 
+    # Black out our own overlay so its bright text can neither be detected
+    # as a panel nor keep the early-out below from firing.
     if HELPER_SCREEN_RECT is not None:
         hx1, hy1, hx2, hy2 = HELPER_SCREEN_RECT
-        h, w = mask.shape[:2]
+        h, w = small.shape[:2]
+
+        # round outwards so the whole helper stays masked at the lower scale
+        hx1, hy1 = hx1 // scale, hy1 // scale
+        hx2, hy2 = -(-hx2 // scale), -(-hy2 // scale)
 
         hx1 = max(0, min(w - 1, hx1))
         hx2 = max(0, min(w, hx2))
         hy1 = max(0, min(h - 1, hy1))
         hy2 = max(0, min(h, hy2))
 
-        if hx2 > hx1 and hy2 > hy1:
-            cv2.rectangle(mask, (hx1, hy1), (hx2, hy2), 0, thickness=-1)
+        if hx2 > hx1 and hy2 > hy1:
+            if small is frame_bgr:
+                small = small.copy()
+            small[hy1:hy2 + 1, hx1:hx2 + 1] = 0
+
+    # an all-ones kernel is applied by OpenCV as separate row/column passes
+    ksize = max(1, 12 // scale)
+    kernel = np.ones((ksize, ksize), np.uint8)
+
+    # HSV value is max(B, G, R), so the mask needs pixels with a channel at
+    # or above the V floor. Whatever survives the opening covers a full
+    # ksize x ksize square of such pixels, and a grid with that stride hits
+    # every such square: if the grid has none, there is no panel.
+    if small[::ksize, ::ksize, :3].max() < PANEL_V_MIN:
+        return None
+
+    if _PANEL_DETECT_UMAT:
+        small = cv2.UMat(np.ascontiguousarray(small))
+
+    hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV)
+
+    lower = np.array([10, 5, PANEL_V_MIN], dtype=np.uint8)
+    upper = np.array([30, 80, 255], dtype=np.uint8)
+
+    mask = cv2.inRange(hsv, lower, upper)
+
+    # anything that survives the opening covers a full kernel-sized square,
+    # so a mask with fewer pixels than that opens to nothing
+    if cv2.countNonZero(mask) < kernel.size:
+        return None
 
-    kernel = np.ones((12, 12), np.uint8)
     mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
+    if _PANEL_DETECT_UMAT:
+        mask = mask.get()
 
     contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
     if not contours:
         return None
 
+    # most contours are specks left over from the mask; drop them by area
+    # in one pass before doing any per-contour geometry
+    areas = np.fromiter(
+        (cv2.contourArea(c) for c in contours), dtype=np.float64, count=len(contours)
+    )
+
     candidates = []
 
-    for c in contours:
+    for i in np.flatnonzero(areas >= min_area):
+        c = contours[i]
+        area = float(areas[i])
+
         x, y, w, h = cv2.boundingRect(c)
         if w <= 0 or h <= 0:
             continue
 
-        area = cv2.contourArea(c)
-        if area < min_area:
-            continue
-
         rect_area = float(w * h)
         fill_ratio = area / rect_area
         if fill_ratio < min_fill_ratio:
             continue
 
+        aspect = w / float(h)
+        if aspect < 0.4 or aspect > 1.8:
+            continue
+
         peri = cv2.arcLength(c, True)
         approx = cv2.approxPolyDP(c, 0.03 * peri, True)
         if len(approx) > max_vertices:
             continue
 
-        aspect = w / float(h)
-        if aspect < 0.4 or aspect > 1.8:
-            continue
-
         candidates.append((x, y, x + w, y + h, area, fill_ratio))
 
     if not candidates:
@@ -2038,7 +2538,12 @@ def find_tooltip_panel_by_color(
     candidates.sort(key=lambda b: (b[0], -(b[4] * b[5])))
 
     x1, y1, x2, y2, _, _ = candidates[0]
-    return (x1, y1, x2, y2)
+    return (
+        x1 * scale,
+        y1 * scale,
+        min(x2 * scale, full_w),
+        min(y2 * scale, full_h),
+    )
 
 
 def _crop_name_region_from_panel_generic(
@@ -2086,39 +2591,30 @@ def crop_name_region_from_panel_alt(frame_bgr, panel_box):
     )
 
 
+# last whitespace-separated token of a line, if it could be a numeral (I-IV)
+_ROMAN_TAIL_RE = re.compile(r"\S\s+(\S{1,4})$")
+
+
 def convert_trailing_roman_numeral(name: str) -> str:
+    """
+    Replace a trailing I-IV (or an OCR look-alike) with its digit.
+
+    The numeral must be its own word, so "Power Cell" is left alone
+    instead of having its "ll" read as II.
+    """
     if not name:
         return name
 
     s = name.rstrip()
-    if not s:
+    m = _ROMAN_TAIL_RE.search(s)
+    if m is None:
         return name
 
-    if len(s.split()) < 2:
+    digit = _ROMAN_TO_DIGIT.get(m.group(1))
+    if digit is None:
         return name
 
-    patterns = [
-        ("IV", "4"),
-        ("III", "3"),
-        ("II", "2"),
-        ("I", "1"),
-    ]
-
-    for roman, digit in patterns:
-        L = len(roman)
-        if len(s) < L:
-            continue
-
-        tail_original = s[-L:]
-
-        tail_norm = tail_original.upper()
-        tail_norm = tail_norm.replace("|", "I").replace("L", "I")
-
-        if tail_norm == roman:
-            new_s = s[:-L] + digit
-            return new_s
-
-    return name
+    return s[: m.start(1)] + digit
 
 
 def ocr_item_lines(name_roi_bgr) -> list[str]:
@@ -2130,22 +2626,32 @@ def ocr_item_lines(name_roi_bgr) -> list[str]:
     if name_roi_bgr is None or name_roi_bgr.size == 0:
         return []
 
-    init_ocr()
-    global OCR_API
+    api = init_ocr()
 
     # Preprocess (same as before)
     gray = cv2.cvtColor(name_roi_bgr, cv2.COLOR_BGR2GRAY)
 
-    target_h = 40
+    # Normalize the text height in both directions: small ROIs (low
+    # resolutions) are upscaled too, so Tesseract always sees glyphs at
+    # the size it handles best.
+    target_h = OCR_TARGET_HEIGHT
     h, w = gray.shape[:2]
-    if h > target_h:
+    if h != target_h:
         scale = target_h / float(h)
-        gray = cv2.resize(gray, (int(w * scale), target_h), interpolation=cv2.INTER_AREA)
-
-    pil_img = Image.fromarray(gray)
+        interp = cv2.INTER_AREA if h > target_h else cv2.INTER_CUBIC
+        gray = cv2.resize(gray, (max(1, int(w * scale)), target_h), interpolation=interp)
+
+    # Binarize here so Tesseract skips its own thresholding pass
+    _, bw = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    fill = cv2.countNonZero(bw) / float(bw.size)
+    if not (OCR_OTSU_MIN_FILL <= fill <= 1.0 - OCR_OTSU_MIN_FILL):
+        bw = cv2.adaptiveThreshold(
+            gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY, 31, 10
+        )
 
-    OCR_API.SetImage(pil_img)
-    text = OCR_API.GetUTF8Text() or ""
+    bh, bwidth = bw.shape[:2]
+    api.SetImageBytes(bw.tobytes(), bwidth, bh, 1, bwidth)
+    text = api.GetUTF8Text() or ""
 
     lines: list[str] = []
     for raw_line in text.splitlines():
@@ -2187,24 +2693,66 @@ def compute_name_roi_hash(name_roi_bgr, diff_threshold=3.0, _cache={}):
     if name_roi_bgr is None or name_roi_bgr.size == 0:
         return None
 
+    # a pixel-identical name region (the common case while hovering one
+    # item) reuses the last hash without the resize and diff below
+    sample = np.ascontiguousarray(
+        name_roi_bgr[::NAME_ROI_SAMPLE_STRIDE, ::NAME_ROI_SAMPLE_STRIDE]
+    )
+    if xxhash is not None:
+        raw_sig = (sample.shape, xxhash.xxh3_64_intdigest(sample))
+    else:
+        raw_sig = (sample.shape, sample.tobytes())
+    if "prev_hash" in _cache and raw_sig == _cache.get("raw_sig"):
+        return _cache["prev_hash"]
+    _cache["raw_sig"] = raw_sig
+
+    # the thumbnail and two grayscale buffers are reused every tick; the gray
+    # buffers alternate so the previous frame's stays intact for the diff
+    small_shape = (16, 64) + name_roi_bgr.shape[2:]
+    if _cache.get("small_shape") != small_shape:
+        _cache["small_shape"] = small_shape
+        _cache["small"] = np.empty(small_shape, np.uint8)
+    if "gray_bufs" not in _cache:
+        _cache["gray_bufs"] = (np.empty((16, 64), np.uint8), np.empty((16, 64), np.uint8))
+
+    prev_gray = _cache.get("prev_gray")
+    buf_a, buf_b = _cache["gray_bufs"]
+    gray_buf = buf_b if prev_gray is buf_a else buf_a
+
     try:
-        small = cv2.resize(name_roi_bgr, (64, 16), interpolation=cv2.INTER_AREA)
-        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        small = cv2.resize(
+            name_roi_bgr, (64, 16), dst=_cache["small"], interpolation=cv2.INTER_AREA
+        )
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=gray_buf)
     except Exception:
         return None
 
-    prev_gray = _cache.get("prev_gray")
-    if prev_gray is not None and prev_gray.shape == gray.shape:
-        diff = np.mean(np.abs(gray.astype(np.int16) - prev_gray.astype(np.int16)))
+    if prev_gray is not None:
+        diff = cv2.norm(gray, prev_gray, cv2.NORM_L1) / gray.size
         if diff < diff_threshold:
             return _cache.get("prev_hash")
 
-    h = gray.tobytes()
+    # a 64-bit digest is a cheap key to compare; without xxhash the raw
+    # thumbnail bytes serve as the key
+    h = xxhash.xxh3_64_intdigest(gray) if xxhash is not None else gray.tobytes()
     _cache["prev_gray"] = gray
     _cache["prev_hash"] = h
     return h
 
 
+def frame_fingerprint(frame_bgr):
+    """
+    Cheap signature of a captured frame, sampled every
+    FRAME_FINGERPRINT_STRIDE pixels in each direction.
+    """
+    sample = np.ascontiguousarray(
+        frame_bgr[::FRAME_FINGERPRINT_STRIDE, ::FRAME_FINGERPRINT_STRIDE]
+    )
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(sample)
+    return sample.tobytes()
+
+
 def set_current_thread_lowest_priority():
     if os.name != "nt":
         return
@@ -2218,18 +2766,17 @@ def set_current_thread_lowest_priority():
 
 
 def ocr_db_worker():
-    global OCR_API
     try:
         init_ocr()
         set_current_thread_lowest_priority()
 
         while True:
-            task = ocr_task_queue.get()
+            task = ocr_task_slot.get()
             if task is None:
-                ocr_task_queue.task_done()
                 break
 
             task_id = task.get("task_id")
+            roi_hash = task.get("roi_hash")
             roi_primary = task.get("roi_primary")
             roi_secondary = task.get("roi_secondary")
             panel_box = task.get("panel_box")
@@ -2239,26 +2786,42 @@ def ocr_db_worker():
                 row = None
                 used_secondary = False
 
-                if roi_primary is not None:
-                    # Get all OCR lines, try each one against the DB
-                    primary_lines = ocr_item_lines(roi_primary)
-                    for ln in primary_lines:
-                        r = find_item_row_by_name(ln)
-                        if r is not None:
-                            name = ln
-                            row = r
-                            break
-
-                if (row is None) and (roi_secondary is not None):
-                    # Fallback: try the secondary ROI (alt name area)
-                    secondary_lines = ocr_item_lines(roi_secondary)
-                    for ln in secondary_lines:
-                        r = find_item_row_by_name(ln)
-                        if r is not None:
-                            name = ln
-                            row = r
-                            used_secondary = True
-                            break
+                cached = None
+                if roi_hash is not None:
+                    with _OCR_RESULT_CACHE_LOCK:
+                        cached = OCR_RESULT_CACHE.get(roi_hash)
+                        if cached is not None:
+                            OCR_RESULT_CACHE.move_to_end(roi_hash)
+
+                if cached is not None:
+                    name, row, used_secondary = cached
+                else:
+                    if roi_primary is not None:
+                        # Get all OCR lines, try each one against the DB
+                        primary_lines = ocr_item_lines(roi_primary)
+                        for ln in primary_lines:
+                            r = find_item_row_by_name(ln)
+                            if r is not None:
+                                name = ln
+                                row = r
+                                break
+
+                    if (row is None) and (roi_secondary is not None):
+                        # Fallback: try the secondary ROI (alt name area)
+                        secondary_lines = ocr_item_lines(roi_secondary)
+                        for ln in secondary_lines:
+                            r = find_item_row_by_name(ln)
+                            if r is not None:
+                                name = ln
+                                row = r
+                                used_secondary = True
+                                break
+
+                    if roi_hash is not None:
+                        with _OCR_RESULT_CACHE_LOCK:
+                            OCR_RESULT_CACHE[roi_hash] = (name, row, used_secondary)
+                            if len(OCR_RESULT_CACHE) > OCR_RESULT_CACHE_SIZE:
+                                OCR_RESULT_CACHE.popitem(last=False)
 
                 ocr_result_queue.put(
                     {
@@ -2280,18 +2843,26 @@ def ocr_db_worker():
                         "error": str(e),
                     }
                 )
-            finally:
-                ocr_task_queue.task_done()
     finally:
-        if OCR_API is not None:
-            OCR_API.End()
-            OCR_API = None
+        api = getattr(_OCR_LOCAL, "api", None)
+        if api is not None:
+            api.End()
+            _OCR_LOCAL.api = None
+
 
+def start_ocr_workers(count: int = OCR_WORKER_COUNT):
+    """
+    Start `count` OCR worker threads sharing ocr_task_slot.
 
-def start_ocr_worker():
-    t = threading.Thread(target=ocr_db_worker, daemon=True)
-    t.start()
-    return t
+    Results carry their task_id, and main_live drops results older than the
+    newest one it has seen, so out-of-order completion is harmless.
+    """
+    threads = []
+    for _ in range(count):
+        t = threading.Thread(target=ocr_db_worker, daemon=True)
+        t.start()
+        threads.append(t)
+    return threads
 
 
 TOOLTIP_ROOT = None
@@ -2301,8 +2872,40 @@ SCREEN_W = 0
 SCREEN_H = 0
 TOOLTIP_VISIBLE = False
 TOOLTIP_CACHE_KEY = None
+# (w, h, x, y) last passed to TOOLTIP_ROOT.geometry()
+_LAST_GEOM = None
+
+# (name, verdict, two-column flag, render settings) -> PhotoImage, least
+# recently shown first; evicting one frees its Tk image (the one on screen
+# stays referenced by TOOLTIP_PHOTO)
+TOOLTIP_IMAGE_CACHE: OrderedDict = OrderedDict()
+TOOLTIP_IMAGE_CACHE_SIZE = 64
+
+# Same keys -> the rendered PIL image. The PhotoImage cache is dropped when
+# the render settings change; this one is not (the settings are part of
+# the key), so switching a setting back re-uses the earlier renders.
+TOOLTIP_PIL_CACHE: OrderedDict = OrderedDict()
+TOOLTIP_PIL_CACHE_SIZE = 32
+
+# settings that change how create_helper_tooltip_image draws; the others
+# (hotkeys, alpha, always_on) never invalidate a rendered tooltip
+TOOLTIP_RENDER_SETTING_KEYS = (
+    "tooltip_font_size",
+    "show_rr_and_crafting",
+    "tooltip_panel_color",
+    "tooltip_text_primary_color",
+    "tooltip_text_secondary_color",
+    "tooltip_keep_color",
+    "tooltip_recycle_color",
+    "tooltip_sell_color",
+)
+
 
-TOOLTIP_IMAGE_CACHE = {}
+def tooltip_settings_signature() -> tuple:
+    """
+    The current values of TOOLTIP_RENDER_SETTING_KEYS, for cache keys.
+    """
+    return tuple(SETTINGS.get(k) for k in TOOLTIP_RENDER_SETTING_KEYS)
 
 LAST_SHOWN_ROW = None
 LAST_SHOWN_PANEL_BOX = None
@@ -2350,7 +2953,13 @@ def parse_color_hex(value: str, default_rgba: tuple[int, int, int, int]) -> tupl
     - If the string is 8 hex digits, the last two are used as alpha.
     - On any error, we fall back to default_rgba.
     """
-    s = safe_str(value).strip()
+    return _parse_color_hex_cached(safe_str(value).strip(), tuple(default_rgba))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_color_hex_cached(
+        s: str, default_rgba: tuple[int, int, int, int]
+) -> tuple[int, int, int, int]:
     if not s:
         return default_rgba
     if s.startswith("#"):
@@ -2380,6 +2989,90 @@ def parse_color_hex(value: str, default_rgba: tuple[int, int, int, int]) -> tupl
         return default_rgba
 
 
+_ITEM_COUNT_RE = re.compile(r"\d+\s*[x×]\s+")
+
+
+def split_items_list(s: str) -> list[str]:
+    """
+    Split an "items" cell ("2x Metal Parts 1x Wires" or comma-separated)
+    into one entry per item.
+    """
+    s = (s or "").strip()
+    if not s:
+        return []
+
+    matches = list(_ITEM_COUNT_RE.finditer(s))
+
+    if matches:
+        parts = []
+        for i, m in enumerate(matches):
+            start = m.start()
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(s)
+            part = s[start:end].strip().strip(",")
+            if part:
+                parts.append(part)
+        return parts
+
+    parts = [p.strip() for p in s.split(",") if p.strip()]
+    return parts if parts else [s]
+
+
+TOOLTIP_FONT_FILE = "arialbd.ttf"
+
+# One line of text in a tooltip; x_off is relative to the column it is
+# filed under ("header"/"left", "right" for RR, "craft").
+TooltipItem = namedtuple("TooltipItem", "x_off y text font fill")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_font(name: str, size: int):
+    """
+    Load a TrueType font once per (file, size); truetype() parses the file.
+    """
+    return ImageFont.truetype(name, size)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_default_font():
+    """
+    PIL's built-in font, used when the TrueType font cannot be loaded.
+    """
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_measure_draw():
+    """
+    Shared 1x1 ImageDraw used only for text measurement.
+    """
+    return ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+
+# Text metrics, keyed by the (cached, long-lived) font object and the text.
+# Labels and common item names recur across every tooltip, so steady-state
+# renders barely touch FreeType.
+@functools.lru_cache(maxsize=8192)
+def _text_width(font, txt: str) -> float:
+    try:
+        return _get_measure_draw().textlength(txt, font=font)
+    except Exception:
+        return font.getsize(txt)[0]
+
+
+@functools.lru_cache(maxsize=8192)
+def _text_height(font, txt: str) -> int:
+    try:
+        bbox = font.getbbox(txt)
+        return bbox[3] - bbox[1]
+    except Exception:
+        return font.getsize(txt)[1]
+
+
+@functools.lru_cache(maxsize=8192)
+def _text_wh(font, txt: str) -> tuple[float, int]:
+    return _text_width(font, txt), _text_height(font, txt)
+
+
 def create_helper_tooltip_image(
         row, detected_name, percent_in_second_column=False
 ):
@@ -2448,51 +3141,14 @@ def create_helper_tooltip_image(
 
         base_size = max(10, min(32, base_size))
 
-        font_title = ImageFont.truetype("arialbd.ttf", 17)
-        font_label = ImageFont.truetype("arialbd.ttf", base_size)
-        font_body = ImageFont.truetype("arialbd.ttf", base_size)
+        font_title = _get_font(TOOLTIP_FONT_FILE, 17)
+        font_label = _get_font(TOOLTIP_FONT_FILE, base_size)
+        font_body = font_label
     except Exception:
-        font_title = ImageFont.load_default()
+        font_title = _get_default_font()
         font_label = font_title
         font_body = font_title
 
-    measure_img = Image.new("RGB", (1, 1))
-    measure_draw = ImageDraw.Draw(measure_img)
-
-    def text_h(font, txt):
-        try:
-            bbox = font.getbbox(txt)
-            return bbox[3] - bbox[1]
-        except Exception:
-            return font.getsize(txt)[1]
-
-    def text_w(font, txt):
-        try:
-            return measure_draw.textlength(txt, font=font)
-        except Exception:
-            return font.getsize(txt)[0]
-
-    def split_items_list(s: str):
-        s = (s or "").strip()
-        if not s:
-            return []
-
-        pattern = re.compile(r"\d+\s*[x×]\s+")
-        matches = list(pattern.finditer(s))
-
-        if matches:
-            parts = []
-            for i, m in enumerate(matches):
-                start = m.start()
-                end = matches[i + 1].start() if i + 1 < len(matches) else len(s)
-                part = s[start:end].strip().strip(",")
-                if part:
-                    parts.append(part)
-            return parts
-
-        parts = [p.strip() for p in s.split(",") if p.strip()]
-        return parts if parts else [s]
-
     # basic item + verdict info
     name_to_show = safe_str(row.get("Name") if row else detected_name)
     if not name_to_show:
@@ -2654,50 +3310,49 @@ def create_helper_tooltip_image(
     if display_rr_list or display_craft_list:
         percent_in_second_column = False
 
-    items = []
+    column_items: dict[str, list[TooltipItem]] = {
+        "header": [],
+        "left": [],
+        "right": [],
+        "craft": [],
+    }
     header_max_width = 0
     left_col_max_width = 0
     rr_col_max_width = 0
     craft_col_max_width = 0
     needed_label_y = None
 
+    def emit_label_and_lines(kind, label, lines, y, max_width, tail_gap=0):
+        """
+        Append a secondary-colour label followed by its indented body lines.
+        Returns the advanced y and the updated column width.
+        """
+        label_w, label_h = _text_wh(font_label, label)
+        max_width = max(max_width, label_w)
+        items = column_items[kind]
+        items.append(TooltipItem(0, y, label, font_label, TEXT_SECONDARY))
+        y += label_h + COMPACT_LINE_GAP
+
+        for line in lines:
+            line_w, line_h = _text_wh(font_body, line)
+            max_width = max(max_width, indent + line_w)
+            items.append(TooltipItem(indent, y, line, font_body, TEXT_PRIMARY))
+            y += line_h + COMPACT_LINE_GAP
+
+        return y + tail_gap, max_width
+
     y = COMPACT_PADDING
     title_y = y
 
-    header_max_width = max(header_max_width, text_w(font_title, name_to_show))
+    header_max_width = max(header_max_width, _text_width(font_title, name_to_show))
     y = COMPACT_LINE_GAP * 2
 
     needed_label = "Needed for Tasks:"
     needed_label_y = y
-    header_max_width = max(header_max_width, text_w(font_label, needed_label))
-    items.append(
-        dict(
-            kind="header",
-            x_off=0,
-            y=needed_label_y,
-            text=needed_label,
-            font=font_label,
-            fill=TEXT_SECONDARY,
-        )
+    y, header_max_width = emit_label_and_lines(
+        "header", needed_label, needed_lines, y, header_max_width,
+        tail_gap=COMPACT_LINE_GAP,
     )
-    y += text_h(font_label, needed_label) + COMPACT_LINE_GAP
-
-    for line in needed_lines:
-        line_w = indent + text_w(font_body, line)
-        header_max_width = max(header_max_width, line_w)
-        items.append(
-            dict(
-                kind="header",
-                x_off=indent,
-                y=y,
-                text=line,
-                font=font_body,
-                fill=TEXT_PRIMARY,
-            )
-        )
-        y += text_h(font_body, line) + COMPACT_LINE_GAP
-
-    y += COMPACT_LINE_GAP
 
     if needed_bullets:
         verdict_label = (
@@ -2708,8 +3363,8 @@ def create_helper_tooltip_image(
     else:
         verdict_label = "My Suggested action:" if is_my_suggestion else "Suggested action:"
 
-    label_w = text_w(font_label, verdict_label)
-    verdict_w = text_w(font_label, verdict)
+    label_w = _text_width(font_label, verdict_label)
+    verdict_w = _text_width(font_label, verdict)
 
     header_max_width = max(
         header_max_width,
@@ -2717,29 +3372,12 @@ def create_helper_tooltip_image(
         indent + verdict_w,
         )
 
-    items.append(
-        dict(
-            kind="header",
-            x_off=0,
-            y=y,
-            text=verdict_label,
-            font=font_label,
-            fill=TEXT_SECONDARY,
-        )
-    )
-    y += text_h(font_label, verdict_label) + COMPACT_LINE_GAP
-
-    items.append(
-        dict(
-            kind="header",
-            x_off=indent,
-            y=y,
-            text=verdict,
-            font=font_label,
-            fill=verdict_col,
-        )
-    )
-    y += text_h(font_label, verdict) + COMPACT_LINE_GAP * 2
+    header_items = column_items["header"]
+    header_items.append(TooltipItem(0, y, verdict_label, font_label, TEXT_SECONDARY))
+    y += _text_height(font_label, verdict_label) + COMPACT_LINE_GAP
+
+    header_items.append(TooltipItem(indent, y, verdict, font_label, verdict_col))
+    y += _text_height(font_label, verdict) + COMPACT_LINE_GAP * 2
 
     columns_top_y = y
     y_left = columns_top_y
@@ -2754,301 +3392,61 @@ def create_helper_tooltip_image(
         y_craft = title_y
 
         if display_rr_list:
-            label = "Reverse Recycle:"
-            rr_col_max_width = max(rr_col_max_width, text_w(font_label, label))
-            items.append(
-                dict(
-                    kind="right",
-                    x_off=0,
-                    y=y_rr,
-                    text=label,
-                    font=font_label,
-                    fill=TEXT_SECONDARY,
-                )
+            y_rr, rr_col_max_width = emit_label_and_lines(
+                "right", "Reverse Recycle:", display_rr_list, y_rr, rr_col_max_width
             )
-            y_rr += text_h(font_label, label) + COMPACT_LINE_GAP
-
-            for line in display_rr_list:
-                w_line = indent + text_w(font_body, line)
-                rr_col_max_width = max(rr_col_max_width, w_line)
-                items.append(
-                    dict(
-                        kind="right",
-                        x_off=indent,
-                        y=y_rr,
-                        text=line,
-                        font=font_body,
-                        fill=TEXT_PRIMARY,
-                    )
-                )
-                y_rr += text_h(font_body, line) + COMPACT_LINE_GAP
 
         if display_craft_list:
             if display_rr_list and rr_display_line_count >= 8:
-                label = "Used for Crafting/Upgrading:"
-                craft_col_max_width = max(craft_col_max_width, text_w(font_label, label))
-                items.append(
-                    dict(
-                        kind="craft",
-                        x_off=0,
-                        y=y_craft,
-                        text=label,
-                        font=font_label,
-                        fill=TEXT_SECONDARY,
-                    )
+                y_craft, craft_col_max_width = emit_label_and_lines(
+                    "craft", "Used for Crafting/Upgrading:", display_craft_list,
+                    y_craft, craft_col_max_width,
                 )
-                y_craft += text_h(font_label, label) + COMPACT_LINE_GAP
-
-                for line in display_craft_list:
-                    w_line = indent + text_w(font_body, line)
-                    craft_col_max_width = max(craft_col_max_width, w_line)
-                    items.append(
-                        dict(
-                            kind="craft",
-                            x_off=indent,
-                            y=y_craft,
-                            text=line,
-                            font=font_body,
-                            fill=TEXT_PRIMARY,
-                        )
-                    )
-                    y_craft += text_h(font_body, line) + COMPACT_LINE_GAP
             else:
                 if display_rr_list:
                     y_rr += COMPACT_LINE_GAP
-                label = "Used for Crafting/Upgrading:"
-                rr_col_max_width = max(rr_col_max_width, text_w(font_label, label))
-                items.append(
-                    dict(
-                        kind="right",
-                        x_off=0,
-                        y=y_rr,
-                        text=label,
-                        font=font_label,
-                        fill=TEXT_SECONDARY,
-                    )
+                y_rr, rr_col_max_width = emit_label_and_lines(
+                    "right", "Used for Crafting/Upgrading:", display_craft_list,
+                    y_rr, rr_col_max_width,
                 )
-                y_rr += text_h(font_label, label) + COMPACT_LINE_GAP
-
-                for line in display_craft_list:
-                    w_line = indent + text_w(font_body, line)
-                    rr_col_max_width = max(rr_col_max_width, w_line)
-                    items.append(
-                        dict(
-                            kind="right",
-                            x_off=indent,
-                            y=y_rr,
-                            text=line,
-                            font=font_body,
-                            fill=TEXT_PRIMARY,
-                        )
-                    )
-                    y_rr += text_h(font_body, line) + COMPACT_LINE_GAP
 
     elif percent_in_second_column:
         y_rr = needed_label_y
 
-        label = "Recycle Value Gain (vs Salvage):"
-        rr_col_max_width = max(rr_col_max_width, text_w(font_label, label))
-        items.append(
-            dict(
-                kind="right",
-                x_off=0,
-                y=y_rr,
-                text=label,
-                font=font_label,
-                fill=TEXT_SECONDARY,
-            )
-        )
-        y_rr += text_h(font_label, label) + COMPACT_LINE_GAP
-
-        w_line = indent + text_w(font_body, rec_gain_text)
-        rr_col_max_width = max(rr_col_max_width, w_line)
-        items.append(
-            dict(
-                kind="right",
-                x_off=indent,
-                y=y_rr,
-                text=rec_gain_text,
-                font=font_body,
-                fill=TEXT_PRIMARY,
-            )
+        y_rr, rr_col_max_width = emit_label_and_lines(
+            "right", "Recycle Value Gain (vs Salvage):", (rec_gain_text,),
+            y_rr, rr_col_max_width, tail_gap=COMPACT_LINE_GAP,
         )
-        y_rr += text_h(font_body, rec_gain_text) + COMPACT_LINE_GAP * 2
-
-        label = "Sell Value Gain (vs Recycle):"
-        rr_col_max_width = max(rr_col_max_width, text_w(font_label, label))
-        items.append(
-            dict(
-                kind="right",
-                x_off=0,
-                y=y_rr,
-                text=label,
-                font=font_label,
-                fill=TEXT_SECONDARY,
-            )
-        )
-        y_rr += text_h(font_label, label) + COMPACT_LINE_GAP
-
-        w_line = indent + text_w(font_body, sell_gain_text)
-        rr_col_max_width = max(rr_col_max_width, w_line)
-        items.append(
-            dict(
-                kind="right",
-                x_off=indent,
-                y=y_rr,
-                text=sell_gain_text,
-                font=font_body,
-                fill=TEXT_PRIMARY,
-            )
+        y_rr, rr_col_max_width = emit_label_and_lines(
+            "right", "Sell Value Gain (vs Recycle):", (sell_gain_text,),
+            y_rr, rr_col_max_width, tail_gap=COMPACT_LINE_GAP,
         )
-        y_rr += text_h(font_body, sell_gain_text) + COMPACT_LINE_GAP * 2
 
     # Left column
-    label = "Recycle:"
-    left_col_max_width = max(left_col_max_width, text_w(font_label, label))
-    items.append(
-        dict(
-            kind="left",
-            x_off=0,
-            y=y_left,
-            text=label,
-            font=font_label,
-            fill=TEXT_SECONDARY,
-        )
+    y_left, left_col_max_width = emit_label_and_lines(
+        "left", "Recycle:", rec_lines, y_left, left_col_max_width,
+        tail_gap=COMPACT_LINE_GAP,
     )
-    y_left += text_h(font_label, label) + COMPACT_LINE_GAP
-
-    for line in rec_lines:
-        w_line = indent + text_w(font_body, line)
-        left_col_max_width = max(left_col_max_width, w_line)
-        items.append(
-            dict(
-                kind="left",
-                x_off=indent,
-                y=y_left,
-                text=line,
-                font=font_body,
-                fill=TEXT_PRIMARY,
-            )
-        )
-        y_left += text_h(font_body, line) + COMPACT_LINE_GAP
-    y_left += COMPACT_LINE_GAP
-
-    label = "Salvage:"
-    left_col_max_width = max(left_col_max_width, text_w(font_label, label))
-    items.append(
-        dict(
-            kind="left",
-            x_off=0,
-            y=y_left,
-            text=label,
-            font=font_label,
-            fill=TEXT_SECONDARY,
-        )
+
+    y_left, left_col_max_width = emit_label_and_lines(
+        "left", "Salvage:", sal_lines, y_left, left_col_max_width,
+        tail_gap=COMPACT_LINE_GAP,
     )
-    y_left += text_h(font_label, label) + COMPACT_LINE_GAP
-
-    for line in sal_lines:
-        w_line = indent + text_w(font_body, line)
-        left_col_max_width = max(left_col_max_width, w_line)
-        items.append(
-            dict(
-                kind="left",
-                x_off=indent,
-                y=y_left,
-                text=line,
-                font=font_body,
-                fill=TEXT_PRIMARY,
-            )
-        )
-        y_left += text_h(font_body, line) + COMPACT_LINE_GAP
-    y_left += COMPACT_LINE_GAP
 
     if not percent_in_second_column:
-        label = "Recycle Value Gain (vs Salvage):"
-        left_col_max_width = max(left_col_max_width, text_w(font_label, label))
-        items.append(
-            dict(
-                kind="left",
-                x_off=0,
-                y=y_left,
-                text=label,
-                font=font_label,
-                fill=TEXT_SECONDARY,
-            )
-        )
-        y_left += text_h(font_label, label) + COMPACT_LINE_GAP
-
-        w_line = indent + text_w(font_body, rec_gain_text)
-        left_col_max_width = max(left_col_max_width, w_line)
-        items.append(
-            dict(
-                kind="left",
-                x_off=indent,
-                y=y_left,
-                text=rec_gain_text,
-                font=font_body,
-                fill=TEXT_PRIMARY,
-            )
-        )
-        y_left += text_h(font_body, rec_gain_text) + COMPACT_LINE_GAP * 2
-
-        label = "Sell Value Gain (vs Recycle):"
-        left_col_max_width = max(left_col_max_width, text_w(font_label, label))
-        items.append(
-            dict(
-                kind="left",
-                x_off=0,
-                y=y_left,
-                text=label,
-                font=font_label,
-                fill=TEXT_SECONDARY,
-            )
-        )
-        y_left += text_h(font_label, label) + COMPACT_LINE_GAP
-
-        w_line = indent + text_w(font_body, sell_gain_text)
-        left_col_max_width = max(left_col_max_width, w_line)
-        items.append(
-            dict(
-                kind="left",
-                x_off=indent,
-                y=y_left,
-                text=sell_gain_text,
-                font=font_body,
-                fill=TEXT_PRIMARY,
-            )
-        )
-        y_left += text_h(font_body, sell_gain_text) + COMPACT_LINE_GAP * 2
-
-    label = "Sell Price per Item:"
-    left_col_max_width = max(left_col_max_width, text_w(font_label, label))
-    items.append(
-        dict(
-            kind="left",
-            x_off=0,
-            y=y_left,
-            text=label,
-            font=font_label,
-            fill=TEXT_SECONDARY,
+        y_left, left_col_max_width = emit_label_and_lines(
+            "left", "Recycle Value Gain (vs Salvage):", (rec_gain_text,),
+            y_left, left_col_max_width, tail_gap=COMPACT_LINE_GAP,
         )
-    )
-    y_left += text_h(font_label, label) + COMPACT_LINE_GAP
-
-    w_line = indent + text_w(font_body, sell_price_text)
-    left_col_max_width = max(left_col_max_width, w_line)
-    items.append(
-        dict(
-            kind="left",
-            x_off=indent,
-            y=y_left,
-            text=sell_price_text,
-            font=font_body,
-            fill=TEXT_PRIMARY,
+        y_left, left_col_max_width = emit_label_and_lines(
+            "left", "Sell Value Gain (vs Recycle):", (sell_gain_text,),
+            y_left, left_col_max_width, tail_gap=COMPACT_LINE_GAP,
         )
+
+    y_left, left_col_max_width = emit_label_and_lines(
+        "left", "Sell Price per Item:", (sell_price_text,), y_left,
+        left_col_max_width, tail_gap=COMPACT_LINE_GAP,
     )
-    y_left += text_h(font_body, sell_price_text) + COMPACT_LINE_GAP * 2
 
     content_bottom = y_left
     if rr_col_max_width > 0:
@@ -3096,26 +3494,17 @@ def create_helper_tooltip_image(
     rr_x = left_x + rr_x_inner if rr_x_inner is not None else None
     craft_x = left_x + craft_x_inner if craft_x_inner is not None else None
 
-    for it in items:
-        kind = it["kind"]
-
-        if kind == "right" and rr_x is None:
-            continue
-        if kind == "craft" and craft_x is None:
+    for kind, base_x in (
+            ("header", left_x),
+            ("left", left_x),
+            ("right", rr_x),
+            ("craft", craft_x),
+    ):
+        if base_x is None:
             continue
-
-        if kind in ("header", "left"):
-            x = left_x + it["x_off"]
-        elif kind == "right":
-            x = rr_x + it["x_off"]
-        elif kind == "craft":
-            x = craft_x + it["x_off"]
-        else:
-            x = left_x + it["x_off"]
-
-        ty = it["y"]
-        if 0 <= ty < used_height:
-            draw.text((x, ty), it["text"], font=it["font"], fill=it["fill"])
+        for x_off, ty, text, font, fill in column_items[kind]:
+            if 0 <= ty < used_height:
+                draw.text((base_x + x_off, ty), text, font=font, fill=fill)
 
     return img
 
@@ -3134,13 +3523,23 @@ def get_helper_gaps():
     return max(gap_x, 1), max(gap_y, 1)
 
 
+if os.name == "nt":
+    from ctypes import wintypes
+
+    _GetCursorPos = ctypes.windll.user32.GetCursorPos
+    _GetCursorPos.argtypes = [ctypes.POINTER(wintypes.POINT)]
+    _GetCursorPos.restype = wintypes.BOOL
+else:
+    wintypes = None
+    _GetCursorPos = None
+
+
 def get_mouse_position():
+    if _GetCursorPos is None:
+        return None, None
     try:
-        class POINT(ctypes.Structure):
-            _fields_ = [("x", ctypes.c_long), ("y", ctypes.c_long)]
-
-        pt = POINT()
-        if ctypes.windll.user32.GetCursorPos(ctypes.byref(pt)):
+        pt = wintypes.POINT()
+        if _GetCursorPos(ctypes.byref(pt)):
             return pt.x, pt.y
     except Exception:
         pass
@@ -3157,7 +3556,7 @@ def show_helper_tooltip(
     then converted to global desktop coordinates once for the Tk window.
     """
     global TOOLTIP_PHOTO, TOOLTIP_VISIBLE, TOOLTIP_CACHE_KEY, TOOLTIP_IMAGE_CACHE
-    global HELPER_SCREEN_RECT, MONITOR_LEFT, MONITOR_TOP
+    global HELPER_SCREEN_RECT, MONITOR_LEFT, MONITOR_TOP, _LAST_GEOM
 
     if global_panel_box is None:
         hide_helper_tooltip()
@@ -3180,19 +3579,37 @@ def show_helper_tooltip(
     effective_verdict = get_effective_verdict(row, detected_name)
 
     def get_photo(percent_in_second_column_flag: bool):
-        key = (row_name, effective_verdict, percent_in_second_column_flag)
-        if key in TOOLTIP_IMAGE_CACHE:
-            return TOOLTIP_IMAGE_CACHE[key], key
-
-        img = create_helper_tooltip_image(
-            row,
-            detected_name,
-            percent_in_second_column=percent_in_second_column_flag,
+        key = (
+            row_name,
+            effective_verdict,
+            percent_in_second_column_flag,
+            tooltip_settings_signature(),
         )
+        photo = TOOLTIP_IMAGE_CACHE.get(key)
+        if photo is not None:
+            TOOLTIP_IMAGE_CACHE.move_to_end(key)
+            return photo, key
+
+        img = TOOLTIP_PIL_CACHE.get(key)
+        if img is None:
+            img = create_helper_tooltip_image(
+                row,
+                detected_name,
+                percent_in_second_column=percent_in_second_column_flag,
+            )
+            TOOLTIP_PIL_CACHE[key] = img
+            if len(TOOLTIP_PIL_CACHE) > TOOLTIP_PIL_CACHE_SIZE:
+                TOOLTIP_PIL_CACHE.popitem(last=False)
+        else:
+            TOOLTIP_PIL_CACHE.move_to_end(key)
+
         photo = ImageTk.PhotoImage(img)
         TOOLTIP_IMAGE_CACHE[key] = photo
+        if len(TOOLTIP_IMAGE_CACHE) > TOOLTIP_IMAGE_CACHE_SIZE:
+            TOOLTIP_IMAGE_CACHE.popitem(last=False)
         return photo, key
 
+    prev_photo = TOOLTIP_PHOTO
     test_photo, test_key = get_photo(False)
     test_w = test_photo.width()
     test_h = test_photo.height()
@@ -3211,7 +3628,8 @@ def show_helper_tooltip(
         w = TOOLTIP_PHOTO.width()
         h = TOOLTIP_PHOTO.height()
 
-    TOOLTIP_LABEL.configure(image=TOOLTIP_PHOTO)
+    if TOOLTIP_PHOTO is not prev_photo:
+        TOOLTIP_LABEL.configure(image=TOOLTIP_PHOTO)
 
     if used_secondary:
         y = int(gy1)
@@ -3315,7 +3733,11 @@ def show_helper_tooltip(
         global_x = int(x + MONITOR_LEFT)
         global_y = int(y + MONITOR_TOP)
 
-        TOOLTIP_ROOT.geometry(f"{w}x{h}+{global_x}+{global_y}")
+        # re-applying an unchanged geometry still costs a Tk round trip
+        geom = (w, h, global_x, global_y)
+        if geom != _LAST_GEOM:
+            TOOLTIP_ROOT.geometry(f"{w}x{h}+{global_x}+{global_y}")
+            _LAST_GEOM = geom
 
         # HELPER_SCREEN_RECT is stored in monitor-local coordinates
         HELPER_SCREEN_RECT = (int(x), int(y), int(x) + w, int(y) + h)
@@ -3357,101 +3779,186 @@ def warm_up_tooltip_engine():
         print("Warmup failed (non-fatal):", e)
 
 
-def _keyboard_hotkey_matches(key) -> bool:
-    if pynput_keyboard is None:
-        return False
-
-    cfg = SETTINGS.get("hotkey") or {}
-    if cfg.get("device") != "keyboard":
-        return False
-
-    target = (cfg.get("key") or "").lower()
-    if not target:
-        return False
-
+def _keyboard_key_name(key) -> str:
     try:
         if isinstance(key, pynput_keyboard.KeyCode):
-            ch = (key.char or "").lower()
-            return ch == target
+            return (key.char or "").lower()
         elif isinstance(key, pynput_keyboard.Key):
-            name = (key.name or "").lower()
-            return name == target
+            return (key.name or "").lower()
     except Exception:
-        return False
+        pass
+    return ""
 
-    return False
 
+def _mouse_button_name(button) -> str:
+    try:
+        return (button.name or "").lower()
+    except Exception:
+        return ""
 
-def _mouse_hotkey_matches(button) -> bool:
-    if pynput_mouse is None:
-        return False
 
-    cfg = SETTINGS.get("hotkey") or {}
-    if cfg.get("device") != "mouse":
+def _keyboard_hotkey_matches(key) -> bool:
+    target = _HOTKEY_TARGETS.get(("hotkey", "keyboard"))
+    if not target or pynput_keyboard is None:
         return False
+    return _keyboard_key_name(key) == target
 
-    target = (cfg.get("key") or "").lower()
-    if not target:
-        return False
 
-    try:
-        name = (button.name or "").lower()
-        return name == target
-    except Exception:
+def _mouse_hotkey_matches(button) -> bool:
+    target = _HOTKEY_TARGETS.get(("hotkey", "mouse"))
+    if not target or pynput_mouse is None:
         return False
+    return _mouse_button_name(button) == target
 
 
 def _keyboard_cycle_hotkey_matches(key) -> bool:
-    if pynput_keyboard is None:
+    target = _HOTKEY_TARGETS.get(("cycle_hotkey", "keyboard"))
+    if not target or pynput_keyboard is None:
         return False
+    return _keyboard_key_name(key) == target
 
-    cfg = SETTINGS.get("cycle_hotkey") or {}
-    if cfg.get("device") != "keyboard":
-        return False
 
-    target = (cfg.get("key") or "").lower()
-    if not target:
+def _mouse_cycle_hotkey_matches(button) -> bool:
+    target = _HOTKEY_TARGETS.get(("cycle_hotkey", "mouse"))
+    if not target or pynput_mouse is None:
         return False
+    return _mouse_button_name(button) == target
+
+
+# Virtual-key codes for the hold hotkey poller (Windows). Names follow the
+# strings stored by the capture dialog / pynput; single characters are
+# resolved through VkKeyScanW so they follow the active keyboard layout.
+HOTKEY_POLL_INTERVAL = 0.001
+# poll interval while no hold hotkey is in use ("Always on", or a key that
+# does not resolve); only settings changes need noticing then
+HOTKEY_IDLE_POLL_INTERVAL = 0.1
+
+_VK_BY_NAME = {
+    "space": 0x20,
+    "tab": 0x09,
+    "enter": 0x0D,
+    "esc": 0x1B,
+    "backspace": 0x08,
+    "caps_lock": 0x14,
+    "shift": 0x10,
+    "shift_l": 0xA0,
+    "shift_r": 0xA1,
+    "ctrl": 0x11,
+    "ctrl_l": 0xA2,
+    "ctrl_r": 0xA3,
+    "alt": 0x12,
+    "alt_l": 0xA4,
+    "alt_r": 0xA5,
+    "alt_gr": 0xA5,
+    "insert": 0x2D,
+    "delete": 0x2E,
+    "home": 0x24,
+    "end": 0x23,
+    "page_up": 0x21,
+    "page_down": 0x22,
+    "up": 0x26,
+    "down": 0x28,
+    "left": 0x25,
+    "right": 0x27,
+}
+_VK_BY_NAME.update({f"f{i}": 0x6F + i for i in range(1, 25)})
+
+_VK_BY_MOUSE_BUTTON = {
+    "left": 0x01,
+    "right": 0x02,
+    "middle": 0x04,
+    "x1": 0x05,
+    "x2": 0x06,
+}
 
-    try:
-        if isinstance(key, pynput_keyboard.KeyCode):
-            ch = (key.char or "").lower()
-            return ch == target
-        elif isinstance(key, pynput_keyboard.Key):
-            name = (key.name or "").lower()
-            return name == target
-    except Exception:
-        return False
+_USER32_INPUT = None
+_HOTKEY_VK_CACHE: dict[tuple[str, str], int | None] = {}
+
+
+def _get_user32_input():
+    """
+    Return user32 with GetAsyncKeyState / VkKeyScanW prototypes set up.
+    """
+    global _USER32_INPUT
+    if _USER32_INPUT is None:
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        user32.GetAsyncKeyState.argtypes = [ctypes.c_int]
+        user32.GetAsyncKeyState.restype = ctypes.c_short
+        user32.VkKeyScanW.argtypes = [ctypes.c_wchar]
+        user32.VkKeyScanW.restype = ctypes.c_short
+        _USER32_INPUT = user32
+    return _USER32_INPUT
+
+
+def _hotkey_vk(device: str, key: str) -> int | None:
+    """
+    Resolve a (device, key) hotkey setting to a Windows virtual-key code.
+    """
+    cache_key = (device, key)
+    if cache_key in _HOTKEY_VK_CACHE:
+        return _HOTKEY_VK_CACHE[cache_key]
 
-    return False
+    vk = None
+    if device == "mouse":
+        vk = _VK_BY_MOUSE_BUTTON.get(key)
+    elif device == "keyboard":
+        vk = _VK_BY_NAME.get(key)
+        if vk is None and len(key) == 1:
+            res = _get_user32_input().VkKeyScanW(key)
+            if res != -1:
+                vk = res & 0xFF
 
+    _HOTKEY_VK_CACHE[cache_key] = vk
+    return vk
 
-def _mouse_cycle_hotkey_matches(button) -> bool:
-    if pynput_mouse is None:
-        return False
 
-    cfg = SETTINGS.get("cycle_hotkey") or {}
-    if cfg.get("device") != "mouse":
-        return False
+def _poll_hold_hotkey_loop():
+    """
+    Track the hold-to-show hotkey with GetAsyncKeyState.
 
-    target = (cfg.get("key") or "").lower()
-    if not target:
-        return False
+    Polling avoids the low-level hook latency of pynput when the game is
+    busy, and only ever answers "is the key down right now?".
+    """
+    global HOTKEY_HELD
+
+    gaks = _get_user32_input().GetAsyncKeyState
+    while True:
+        vk = None
+        if not SETTINGS.get("always_on", False):
+            cfg = SETTINGS.get("hotkey") or {}
+            vk = _hotkey_vk(cfg.get("device") or "", (cfg.get("key") or "").lower())
+
+        if vk is None:
+            HOTKEY_HELD = False
+            time.sleep(HOTKEY_IDLE_POLL_INTERVAL)
+            continue
 
-    try:
-        name = (button.name or "").lower()
-        return name == target
-    except Exception:
-        return False
+        HOTKEY_HELD = bool(gaks(vk) & 0x8000)
+        time.sleep(HOTKEY_POLL_INTERVAL)
 
 
 def start_hotkey_listeners():
-    global HOTKEY_LISTENERS_STARTED, HOTKEY_HELD
+    global HOTKEY_LISTENERS_STARTED, HOTKEY_HELD, HOTKEY_POLLING
 
     if HOTKEY_LISTENERS_STARTED:
         return
 
+    if os.name == "nt" and not HOTKEY_POLLING:
+        try:
+            _get_user32_input()
+            threading.Thread(target=_poll_hold_hotkey_loop, daemon=True).start()
+            HOTKEY_POLLING = True
+        except Exception as e:
+            print("[helper] GetAsyncKeyState polling unavailable, using pynput:", e)
+
     if not PYNPUT_AVAILABLE:
+        if HOTKEY_POLLING:
+            print(
+                "[helper] pynput not installed; the cycle hotkey is disabled.\n"
+                "         Install it with: pip install pynput"
+            )
+            HOTKEY_LISTENERS_STARTED = True
+            return
         print(
             "[helper] pynput not installed; hotkey support is disabled.\n"
             "         Install it with: pip install pynput\n"
@@ -3462,7 +3969,7 @@ def start_hotkey_listeners():
     def on_press(key):
         global HOTKEY_HELD
         try:
-            if _keyboard_hotkey_matches(key):
+            if not HOTKEY_POLLING and _keyboard_hotkey_matches(key):
                 HOTKEY_HELD = True
 
             if _keyboard_cycle_hotkey_matches(key):
@@ -3473,7 +3980,7 @@ def start_hotkey_listeners():
     def on_release(key):
         global HOTKEY_HELD
         try:
-            if _keyboard_hotkey_matches(key):
+            if not HOTKEY_POLLING and _keyboard_hotkey_matches(key):
                 HOTKEY_HELD = False
         except Exception:
             pass
@@ -3481,7 +3988,7 @@ def start_hotkey_listeners():
     def on_click(x, y, button, pressed):
         global HOTKEY_HELD
         try:
-            if _mouse_hotkey_matches(button):
+            if not HOTKEY_POLLING and _mouse_hotkey_matches(button):
                 HOTKEY_HELD = pressed
 
             if pressed and _mouse_cycle_hotkey_matches(button):
@@ -3499,97 +4006,136 @@ def start_hotkey_listeners():
     HOTKEY_LISTENERS_STARTED = True
 
 
-def get_arc_raiders_monitor(sct, game_title: str = "ARC Raiders"):
+# How often the live loop re-checks which monitor the game is on.
+GAME_MONITOR_REFRESH_INTERVAL = 5.0
+
+# the game window found by the last title search; reused (only its rect is
+# re-read) for as long as the handle is still a window
+_CACHED_HWND = None
+
+# (left, top, right, bottom, monitor) per real monitor, built from
+# sct.monitors the first time the game window is located
+_MONITORS: tuple = ()
+_MONITORS_SOURCE = None
+
+if os.name == "nt":
+    _user32 = ctypes.windll.user32
+
+    _EnumWindowsProc = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+    _EnumWindows = _user32.EnumWindows
+    _EnumWindows.argtypes = [_EnumWindowsProc, wintypes.LPARAM]
+    _EnumWindows.restype = wintypes.BOOL
+    _IsWindow = _user32.IsWindow
+    _IsWindow.argtypes = [wintypes.HWND]
+    _IsWindow.restype = wintypes.BOOL
+    _IsWindowVisible = _user32.IsWindowVisible
+    _IsWindowVisible.argtypes = [wintypes.HWND]
+    _IsWindowVisible.restype = wintypes.BOOL
+    _GetWindowTextLengthW = _user32.GetWindowTextLengthW
+    _GetWindowTextLengthW.argtypes = [wintypes.HWND]
+    _GetWindowTextLengthW.restype = ctypes.c_int
+    _GetWindowTextW = _user32.GetWindowTextW
+    _GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+    _GetWindowTextW.restype = ctypes.c_int
+    _GetWindowRect = _user32.GetWindowRect
+    _GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+    _GetWindowRect.restype = wintypes.BOOL
+
+
+def find_game_window(game_title: str):
     """
-    Try to find the monitor that contains the ARC Raiders window.
-
-    - On Windows: enumerate top-level windows, find one whose title contains
-      `game_title`, get its rect and select the monitor whose bounds contain
-      the window center.
-    - On other platforms or if not found: fall back to sct.monitors[1]
-      (current behavior).
+    Return the HWND of the first visible top-level window whose title
+    contains `game_title` (case-insensitive), or None.
     """
-    # Non-Windows: just use primary monitor as before
-    if os.name != "nt":
-        return sct.monitors[1]
-
-    user32 = ctypes.windll.user32
-
-    EnumWindows = user32.EnumWindows
-    EnumWindowsProc = ctypes.WINFUNCTYPE(
-        ctypes.c_bool, ctypes.c_void_p, ctypes.c_void_p
-    )
-    GetWindowTextLengthW = user32.GetWindowTextLengthW
-    GetWindowTextW = user32.GetWindowTextW
-    IsWindowVisible = user32.IsWindowVisible
-    GetWindowRect = user32.GetWindowRect
-
-    target_hwnd = ctypes.c_void_p()
-
+    target_hwnd = None
     game_title_lower = game_title.lower()
 
     def callback(hwnd, lParam):
         nonlocal target_hwnd
 
         # Only visible windows
-        if not IsWindowVisible(hwnd):
+        if not _IsWindowVisible(hwnd):
             return True
 
-        length = GetWindowTextLengthW(hwnd)
+        length = _GetWindowTextLengthW(hwnd)
         if length == 0:
             return True
 
         buf = ctypes.create_unicode_buffer(length + 1)
-        GetWindowTextW(hwnd, buf, length + 1)
+        _GetWindowTextW(hwnd, buf, length + 1)
         title = buf.value.strip()
 
         if not title:
             return True
 
         if game_title_lower in title.lower():
-            target_hwnd = ctypes.c_void_p(hwnd)
+            target_hwnd = hwnd
             # Stop enumeration
             return False
 
         return True
 
     try:
-        EnumWindows(EnumWindowsProc(callback), 0)
+        _EnumWindows(_EnumWindowsProc(callback), 0)
     except Exception:
         # In case EnumWindows fails, just fall back
-        target_hwnd = ctypes.c_void_p()
+        return None
+
+    return target_hwnd
+
+
+def get_arc_raiders_monitor(sct, game_title: str = "ARC Raiders"):
+    """
+    Try to find the monitor that contains the ARC Raiders window.
+
+    - On Windows: find a top-level window whose title contains `game_title`,
+      get its rect and select the monitor whose bounds contain the window
+      center. The window handle is cached while it stays valid, so
+      repeated calls only re-read the rect.
+    - On other platforms or if not found: fall back to sct.monitors[1]
+      (current behavior).
+    """
+    global _CACHED_HWND, _MONITORS, _MONITORS_SOURCE
+
+    # Non-Windows: just use primary monitor as before
+    if os.name != "nt":
+        return sct.monitors[1]
+
+    hwnd = _CACHED_HWND
+    if hwnd is None or not _IsWindow(hwnd):
+        hwnd = find_game_window(game_title)
+        _CACHED_HWND = hwnd
 
     # If we didn't find a matching window, use primary
-    if not target_hwnd.value:
+    if not hwnd:
         return sct.monitors[1]
 
     # Get window rect
-    rect = (ctypes.c_long * 4)()
-    if not GetWindowRect(target_hwnd, rect):
+    rect = wintypes.RECT()
+    if not _GetWindowRect(hwnd, ctypes.byref(rect)):
         # If GetWindowRect fails, fall back
+        _CACHED_HWND = None
         return sct.monitors[1]
 
-    left, top, right, bottom = rect
-    win_cx = (left + right) // 2
-    win_cy = (top + bottom) // 2
-
-    # mss.monitors[0] is the virtual screen; real monitors start at index 1
-    chosen_monitor = None
-    for m in sct.monitors[1:]:
-        m_left = m.get("left", 0)
-        m_top = m.get("top", 0)
-        m_width = m.get("width", 0)
-        m_height = m.get("height", 0)
-
-        m_right = m_left + m_width
-        m_bottom = m_top + m_height
-
+    win_cx = (rect.left + rect.right) // 2
+    win_cy = (rect.top + rect.bottom) // 2
+
+    monitors = sct.monitors
+    if monitors is not _MONITORS_SOURCE:
+        # mss.monitors[0] is the virtual screen; real monitors start at index 1
+        bounds = []
+        for m in monitors[1:]:
+            m_left = m.get("left", 0)
+            m_top = m.get("top", 0)
+            m_right = m_left + m.get("width", 0)
+            m_bottom = m_top + m.get("height", 0)
+            bounds.append((m_left, m_top, m_right, m_bottom, m))
+        _MONITORS = tuple(bounds)
+        _MONITORS_SOURCE = monitors
+
+    for m_left, m_top, m_right, m_bottom, m in _MONITORS:
         if m_left <= win_cx < m_right and m_top <= win_cy < m_bottom:
-            chosen_monitor = m
-            break
-
-    if chosen_monitor is not None:
-        return chosen_monitor
+            return m
 
     # If the window center didn't fall inside any monitor (weird edge case),
     # keep old behavior
@@ -3610,6 +4156,8 @@ def main_live():
     SCREEN_H = monitor.get("height", SCREEN_H)
 
     last_settings_mtime = None
+    next_settings_stat = 0.0
+    next_monitor_check = time.monotonic() + GAME_MONITOR_REFRESH_INTERVAL
     try:
         if SETTINGS_PATH.is_file():
             last_settings_mtime = SETTINGS_PATH.stat().st_mtime
@@ -3627,22 +4175,66 @@ def main_live():
     next_task_id = 0
     latest_result_id = -1
 
+    # adaptive detection cadence (see DETECTION_IDLE_INTERVAL_MAX)
+    last_frame_sig = None
+    last_detected_box = None
+    idle_ticks = 0
+    interval = DETECTION_INTERVAL
+
     print("Starting live detection. Press Ctrl+C to stop.")
     try:
         while True:
-            start = time.time()
+            start = time.monotonic()
 
             try:
-                if SETTINGS_PATH.is_file():
-                    mtime = SETTINGS_PATH.stat().st_mtime
-                    if last_settings_mtime is None or mtime > last_settings_mtime:
-                        last_settings_mtime = mtime
-                        refresh_settings()
-                        TOOLTIP_IMAGE_CACHE.clear()
-                        TOOLTIP_NEEDS_REFRESH = True
+                render_sig = tooltip_settings_signature()
+                pushed = take_pushed_settings()
+                if pushed is not None:
+                    refresh_settings(pushed)
+                    # the UI saves before pushing, so this write is already applied
+                    if SETTINGS_PATH.is_file():
+                        last_settings_mtime = SETTINGS_PATH.stat().st_mtime
+                elif (
+                        SETTINGS_FILE_CHANGED.is_set()
+                        if SETTINGS_WATCHER_ACTIVE
+                        else start >= next_settings_stat
+                ):
+                    # the UI pushes its saves; the file only needs checking
+                    # for edits made by hand, on a watcher event or else
+                    # once a second
+                    SETTINGS_FILE_CHANGED.clear()
+                    next_settings_stat = start + SETTINGS_STAT_INTERVAL
+                    if SETTINGS_PATH.is_file():
+                        mtime = SETTINGS_PATH.stat().st_mtime
+                        if last_settings_mtime is None or mtime > last_settings_mtime:
+                            last_settings_mtime = mtime
+                            refresh_settings()
+
+                # only a change to how tooltips look needs a re-render
+                if tooltip_settings_signature() != render_sig:
+                    TOOLTIP_IMAGE_CACHE.clear()
+                    TOOLTIP_NEEDS_REFRESH = True
             except Exception:
                 pass
 
+            if start >= next_monitor_check:
+                # follow the game if it was moved to another monitor
+                next_monitor_check = start + GAME_MONITOR_REFRESH_INTERVAL
+                try:
+                    new_monitor = get_arc_raiders_monitor(sct)
+                except Exception:
+                    new_monitor = monitor
+                if new_monitor != monitor:
+                    monitor = new_monitor
+                    MONITOR_LEFT = monitor.get("left", 0)
+                    MONITOR_TOP = monitor.get("top", 0)
+                    SCREEN_W = monitor.get("width", SCREEN_W)
+                    SCREEN_H = monitor.get("height", SCREEN_H)
+                    last_frame_sig = None
+                    last_detected_box = None
+                    last_name_roi_hash = None
+                    TOOLTIP_NEEDS_REFRESH = True
+
             always_on = bool(SETTINGS.get("always_on", False))
             gating_active = always_on or HOTKEY_HELD
 
@@ -3650,10 +4242,25 @@ def main_live():
 
             if gating_active:
                 sct_img = sct.grab(monitor)
-                # frame_full is in monitor-local coordinates (0..width, 0..height)
-                frame_full = np.array(sct_img)[:, :, :3]
+                # frame_full is in monitor-local coordinates (0..width, 0..height).
+                # It is the BGRA grab buffer itself: OpenCV's BGR conversions
+                # accept (and ignore) the 4th channel, and keeping the buffer
+                # contiguous spares every consumer an internal full-frame copy.
+                frame_full = np.frombuffer(sct_img.raw, dtype=np.uint8).reshape(
+                    sct_img.height, sct_img.width, 4
+                )
 
-                panel_box = find_tooltip_panel_by_color(frame_full)
+                # an identical screen (and helper position) gives an
+                # identical detection, so reuse the last one
+                frame_sig = (frame_fingerprint(frame_full), HELPER_SCREEN_RECT)
+                if frame_sig == last_frame_sig:
+                    idle_ticks += 1
+                    panel_box = last_detected_box
+                else:
+                    idle_ticks = 0
+                    last_frame_sig = frame_sig
+                    panel_box = find_tooltip_panel_by_color(frame_full)
+                    last_detected_box = panel_box
 
                 if panel_box is not None:
                     missing_frames = 0
@@ -3670,22 +4277,19 @@ def main_live():
                     roi_hash = compute_name_roi_hash(name_roi_primary)
 
                     if roi_hash is not None and roi_hash != last_name_roi_hash:
-                        now = time.time()
-                        if now - LAST_OCR_TIME >= OCR_MIN_INTERVAL:
+                        if start - LAST_OCR_TIME >= OCR_MIN_INTERVAL:
                             last_name_roi_hash = roi_hash
-                            LAST_OCR_TIME = now
+                            LAST_OCR_TIME = start
 
                             next_task_id += 1
                             task = {
                                 "task_id": next_task_id,
+                                "roi_hash": roi_hash,
                                 "roi_primary": name_roi_primary,
                                 "roi_secondary": name_roi_secondary,
                                 "panel_box": panel_box,
                             }
-                            try:
-                                ocr_task_queue.put_nowait(task)
-                            except queue.Full:
-                                pass
+                            ocr_task_slot.put(task)
                 else:
                     missing_frames += 1
                     if missing_frames >= MISSING_FRAMES_BEFORE_HIDE:
@@ -3791,9 +4395,19 @@ def main_live():
                 except tk.TclError:
                     pass
 
-            elapsed = time.time() - start
-            if elapsed < DETECTION_INTERVAL:
-                time.sleep(DETECTION_INTERVAL - elapsed)
+            if not gating_active:
+                last_frame_sig = None
+                idle_ticks = 0
+
+            ocr_pending = next_task_id > 0 and latest_result_id < next_task_id
+            if idle_ticks < DETECTION_IDLE_TICKS or ocr_pending:
+                interval = DETECTION_INTERVAL
+            else:
+                interval = min(interval * 2, DETECTION_IDLE_INTERVAL_MAX)
+
+            elapsed = time.monotonic() - start
+            if elapsed < interval:
+                time.sleep(interval - elapsed)
 
     except KeyboardInterrupt:
         print("Stopping live detection.")
@@ -3805,13 +4419,15 @@ def main_live():
                 TOOLTIP_ROOT.destroy()
             except tk.TclError:
                 pass
-        try:
-            ocr_task_queue.put_nowait(None)
-        except queue.Full:
-            pass
+        ocr_task_slot.close()
 
 
 def run_helper():
+    # the catalog download/parse overlaps the OpenCV/OCR imports below
+    start_item_catalog_load()
+    load_helper_modules()
+    start_settings_pipe_reader()
+    start_settings_watcher()
     refresh_settings()
     load_user_verdicts()
     print(f"Loaded settings from {SETTINGS_PATH}: {SETTINGS}")
@@ -3833,8 +4449,19 @@ def run_helper():
         )
 
     set_low_priority()
+    # the warm-up render and everything after it read the catalog; a failed
+    # load ends the helper here, as it did when the catalog loaded at import
+    load_item_catalog_blocking()
+    print(f"Loaded {len(arc_raider_item_names)} catalog item(s)")
     warm_up_tooltip_engine()
-    _ = start_ocr_worker()
+
+    # Everything loaded so far (modules, catalog, lookup tables) lives for
+    # the whole session; move it out of the collector's view so the
+    # periodic full collections that hold the GIL stay short.
+    gc.collect()
+    gc.freeze()
+
+    _ = start_ocr_workers()
     start_hotkey_listeners()
 
     main_live()